@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+DATA_CLEANING_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seller_segmentation_and_targeting", "data_cleaning"
+)
+
+# Seconds the data_cleaning modules may add on top of importing pandas and NumPy
+IMPORT_BUDGET_SECONDS = 0.05
+# Seconds a DataProcessor and ExtractVariables pair may take once the shared data is built
+REPEAT_CONSTRUCTION_BUDGET_SECONDS = 0.005
+
+# Runs in a fresh interpreter: times the imports and the first and repeated construction
+# of the pipeline objects, and lists the files the imports created in the working directory
+PROBE = r"""
+import json, os, sys, time
+sys.path.append({directory!r})
+import numpy, pandas
+before = set(os.listdir("."))
+start = time.perf_counter()
+import data_ingestion, data_cleaner_and_processor, pipeline, result_cache, instrumentation
+imported = time.perf_counter()
+created_on_import = sorted(set(os.listdir(".")) - before)
+data_cleaner_and_processor.DataProcessor()
+data_cleaner_and_processor.ExtractVariables()
+first = time.perf_counter()
+data_cleaner_and_processor.DataProcessor()
+data_cleaner_and_processor.ExtractVariables()
+second = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "first_construction_seconds": first - imported,
+    "repeat_construction_seconds": second - first,
+    "created_on_import": created_on_import,
+}}))
+"""
+
+
+def probe():
+    with tempfile.TemporaryDirectory() as directory:
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(directory=DATA_CLEANING_DIR)],
+            cwd=directory, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the data_cleaning import-time budget, e.g. python benchmarks/bench_import.py.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to start; the fastest run is reported.")
+    args = parser.parse_args(argv)
+
+    runs = [probe() for _ in range(args.repeat)]
+    best = {key: min(run[key] for run in runs) for key in ("import_seconds", "first_construction_seconds", "repeat_construction_seconds")}
+    created = sorted({name for run in runs for name in run["created_on_import"]})
+    print(f"import data_cleaning modules: {best['import_seconds'] * 1000:.1f} ms (budget {IMPORT_BUDGET_SECONDS * 1000:.0f} ms)")
+    print(f"first DataProcessor + ExtractVariables: {best['first_construction_seconds'] * 1000:.1f} ms")
+    print(f"repeat DataProcessor + ExtractVariables: {best['repeat_construction_seconds'] * 1000:.2f} ms (budget {REPEAT_CONSTRUCTION_BUDGET_SECONDS * 1000:.0f} ms)")
+    print(f"files created on import: {created or 'none'}")
+
+    failures = []
+    if best["import_seconds"] > IMPORT_BUDGET_SECONDS:
+        failures.append("import time over budget")
+    if best["repeat_construction_seconds"] > REPEAT_CONSTRUCTION_BUDGET_SECONDS:
+        failures.append("repeat construction over budget")
+    if created:
+        failures.append("import created files")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
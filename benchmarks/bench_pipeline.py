@@ -0,0 +1,142 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+# Importing synthetic_listings puts the data_cleaning modules on sys.path
+from synthetic_listings import generate_listings
+from data_ingestion import read_dataset
+from data_cleaner_and_processor import BACKENDS, DataProcessor, ExtractVariables
+from grammar_profile import BranchProfiler, profile_branches
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+
+
+def pipeline_stages(processor: DataProcessor, extractor: ExtractVariables, backend="pandas"):
+    """
+    The stages of DataProcessor.process followed by those of ExtractVariables.extract, in order.
+    The polars backend runs each of the two as a single query, so it has one stage per class.
+    """
+    if backend == "polars":
+        return [
+            ("polars_process", lambda df: processor.process(df, backend="polars")),
+            ("polars_extract", lambda df: extractor.extract(df, backend="polars")),
+        ]
+    evaluate_unique = processor.evaluate_unique
+    return [
+        ("extract_and_fill_size", processor.extract_and_fill_size),
+        ("enhanced_fraction_parsing", lambda df: processor.enhanced_fraction_parsing(df, evaluate_unique)),
+        ("convert_to_acreage", lambda df: processor.convert_to_acreage(df, evaluate_unique)),
+        ("clean_price", processor.clean_price),
+        ("extract_county", extractor.extract_county),
+        ("add_census_columns", extractor.add_census_columns),
+        ("add_years_on_jiji", extractor.add_years_on_jiji),
+    ]
+
+
+def run_stages(path, processor, extractor, trace_memory, backend="pandas"):
+    """Reads the CSV and runs every stage once, returning one result dict per stage."""
+    results = []
+
+    def measure(name, func, arg, rows):
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        out = func(arg)
+        seconds = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        results.append({"stage": name, "rows_in": rows, "seconds": seconds, "peak_bytes": peak})
+        return out
+
+    df = measure("read_dataset", read_dataset, path, None)
+    results[-1]["rows_in"] = len(df)
+    for name, func in pipeline_stages(processor, extractor, backend):
+        df = measure(name, func, df, len(df))
+    return results
+
+
+def benchmark(rows, seed=0, evaluate_unique=True, memory=True, profiler=None, backend="pandas"):
+    """
+    Benchmarks the cleaning pipeline on synthetic listings.
+
+    Stage timings come from an untraced run; when memory is True a second, traced run
+    records each stage's peak Python-heap allocation with tracemalloc. When a BranchProfiler
+    is given, it profiles the size branches of the untraced run, which only the pandas backend
+    reports to.
+
+    Returns:
+        list: One dict per stage with rows_in, seconds, rows_per_second and peak_bytes.
+    """
+    processor = DataProcessor(evaluate_unique)
+    extractor = ExtractVariables(evaluate_unique)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"listings_{rows}.csv")
+        generate_listings(rows, seed).to_csv(path, index=False)
+        with profile_branches(profiler) if profiler else contextlib.nullcontext():
+            results = run_stages(path, processor, extractor, trace_memory=False, backend=backend)
+        if memory:
+            traced = run_stages(path, processor, extractor, trace_memory=True, backend=backend)
+            for result, traced_result in zip(results, traced):
+                result["peak_bytes"] = traced_result["peak_bytes"]
+    for result in results:
+        result["rows_per_second"] = result["rows_in"] / result["seconds"] if result["seconds"] else float("inf")
+    return results
+
+
+def format_results(rows, results):
+    lines = [f"\n{rows:,} listings", f"{'stage':<28}{'rows in':>12}{'seconds':>10}{'rows/s':>14}{'peak MB':>10}"]
+    for result in results:
+        peak = "-" if result["peak_bytes"] is None else f"{result['peak_bytes'] / 2**20:.1f}"
+        lines.append(
+            f"{result['stage']:<28}{result['rows_in']:>12,}{result['seconds']:>10.3f}"
+            f"{result['rows_per_second']:>14,.0f}{peak:>10}"
+        )
+    total = sum(result["seconds"] for result in results)
+    lines.append(f"{'total':<28}{'':>12}{total:>10.3f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the land listings cleaning pipeline on synthetic data, e.g. python benchmarks/bench_pipeline.py --rows 10000 100000.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Dataset sizes to benchmark.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--per-row", action="store_true", help="Evaluate transforms once per row instead of per distinct value.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced run that measures peak memory.")
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    parser.add_argument("--profile-branches", action="store_true", help="Count and time each size grammar and conversion branch.")
+    parser.add_argument("--backend", choices=BACKENDS, default="pandas", help="Backend of DataProcessor.process and ExtractVariables.extract.")
+    args = parser.parse_args(argv)
+
+    # The pipeline logs every stage; keep the report readable
+    logging.disable(logging.INFO)
+    report = {}
+    for rows in args.rows:
+        profiler = BranchProfiler() if args.profile_branches else None
+        results = benchmark(rows, args.seed, evaluate_unique=not args.per_row, memory=not args.no_memory,
+                            profiler=profiler, backend=args.backend)
+        report[rows] = results
+        print(format_results(rows, results), flush=True)
+        if profiler:
+            print(profiler.format_report(), flush=True)
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux
+            print(f"process peak RSS so far: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB", flush=True)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+DATA_CLEANING_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seller_segmentation_and_targeting", "data_cleaning"
+)
+if DATA_CLEANING_DIR not in sys.path:
+    sys.path.append(DATA_CLEANING_DIR)
+
+from utilities import Utilities
+
+# Size phrasings covering every branch of the size grammar
+WRITTEN = ["one", "two", "three", "five", "ten", "twenty", "Two", "Five", "Fifty", "one hundred"]
+WRITTEN_FRACTIONS = ["quarter", "Quarter", "half", "Half", "eighth", "Eighth", "sixth", "tenth"]
+AREA_UNITS = ["acre", "acres", "Acres", "ac", "ha", "hectare", "hectares", "HA"]
+DIMENSION_UNITS = ["", "ft", " ft", "feet", "m"]
+DIMENSION_SEPARATORS = ["x", " x ", "X", "*", " by ", "×"]
+FRACTIONS = ["1/8", "1/4", "1/2", "3/4", "1/16", "1/3", "2/3"]
+PLOT_KINDS = ["plot", "land", "prime plot", "residential plot", "agricultural land", "commercial plot", "parcel"]
+FILLERS = [
+    "Title deed ready.", "Near tarmac road.", "Water and electricity on site.", "Ready for construction.",
+    "Gated community.", "Controlled development.", "Call for site visit.", "Flat and fertile.",
+]
+PROPERTY_USE = ["Residential", "Agricultural", "Commercial", "Mixed-use", "Industrial", np.nan]
+PRICE_PERIOD = [np.nan, np.nan, np.nan, "per Acre", " per Acre ", "per plot"]
+LISTING_BY = ["Agent", "Owner", "Developer", np.nan]
+
+
+def size_phrases(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Draws n size phrases across the written, numeric, hectare, dimension, fraction and plot-count forms."""
+    kinds = rng.integers(0, 9, n)
+    phrases = np.empty(n, dtype=object)
+    for i, kind in enumerate(kinds):
+        if kind == 0:
+            phrase = f"{rng.choice(WRITTEN)} {rng.choice(AREA_UNITS)}"
+        elif kind == 1:
+            phrase = f"{rng.choice(WRITTEN_FRACTIONS)} {rng.choice(['', 'an ', 'an '])}acre"
+        elif kind == 2:
+            phrase = f"{rng.integers(1, 200)}{rng.choice(['', ' '])}{rng.choice(AREA_UNITS)}"
+        elif kind == 3:
+            phrase = f"{rng.integers(1, 50)}.{rng.integers(1, 9)} {rng.choice(AREA_UNITS)}"
+        elif kind == 4:
+            phrase = f"{rng.integers(1, 10)}-acre"
+        elif kind == 5:
+            length, width = rng.choice([40, 50, 60, 80, 100, 120], 2)
+            unit = rng.choice(DIMENSION_UNITS)
+            phrase = f"{length}{unit}{rng.choice(DIMENSION_SEPARATORS)}{width}{unit}"
+        elif kind == 6:
+            phrase = f"{rng.choice(FRACTIONS)}{rng.choice(['', ' ', 'th ', '-'])}{rng.choice(['acre', 'acres', 'ac'])}"
+        elif kind == 7:
+            phrase = f"Number of plots: {rng.integers(1, 20)}"
+        else:
+            phrase = rng.choice(["slightly more than a quarter acre", "650 / acre", "1/2", "1/4"])
+        phrases[i] = phrase
+    return phrases
+
+
+def generate_listings(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates synthetic Jiji-style land listings.
+
+    Sizes are drawn from a pool of phrasings the size grammar understands and placed in the title,
+    description or property details; regions come from Utilities.kenyan_counties, with some
+    unknown places so the county fallback runs too.
+
+    Args:
+        rows (int): Number of listings.
+        seed (int): Random seed; the same seed gives the same listings.
+
+    Returns:
+        pd.DataFrame: Listings with the columns of the Jiji export the pipeline reads, plus a few it drops.
+    """
+    rng = np.random.default_rng(seed)
+    counties = Utilities().get_kenyan_counties()
+    county_names = np.array(list(counties), dtype=object)
+    locations = np.array([location for places in counties.values() for location in places], dtype=object)
+    parents = np.array([county for county, places in counties.items() for _ in places], dtype=object)
+
+    # A pool of phrases keeps generation vectorized at 1M rows while staying varied
+    pool = size_phrases(rng, min(rows, 20_000) or 1)
+    sizes = pd.Series(pool[rng.integers(0, len(pool), rows)])
+    kinds = pd.Series(rng.choice(PLOT_KINDS, rows))
+    place_index = rng.integers(0, len(locations), rows)
+    unknown = rng.random(rows) < 0.05
+    region_name = pd.Series(np.where(unknown, "Unknown Estate", locations[place_index]), dtype=object)
+    region_parent_name = pd.Series(np.where(rng.random(rows) < 0.5, parents[place_index], county_names[rng.integers(0, len(county_names), rows)]), dtype=object)
+    fillers = pd.Series(rng.choice(FILLERS, rows))
+
+    # Put the size in the title, the description or the property details, or leave it out
+    placement = rng.choice(4, rows, p=[0.5, 0.3, 0.15, 0.05])
+    title = kinds.str.capitalize() + " for sale in " + region_name
+    title = title.where(placement != 0, sizes + " " + title)
+    description = fillers.where(placement != 1, fillers + " Size: " + sizes + ".")
+    property_details = pd.Series(np.where(placement == 2, sizes, None), dtype=object)
+
+    years = rng.integers(0, 12, rows)
+    months = rng.integers(0, 12, rows)
+    time_on_jiji = np.where(
+        years == 0, pd.Series(months).astype(str) + " months",
+        pd.Series(years).astype(str) + " years, " + pd.Series(months).astype(str) + " months"
+    )
+
+    return pd.DataFrame({
+        "id": np.arange(1, rows + 1),
+        "guid": [f"{value:032x}" for value in rng.integers(0, 2**62, rows)],
+        "title": title,
+        "description": description,
+        "property_details": property_details,
+        "price": rng.integers(100, 100_000, rows) * 1_000.0,
+        "price_view": "KSh",
+        "price_period": rng.choice(np.array(PRICE_PERIOD, dtype=object), rows),
+        "region_name": region_name,
+        "region_parent_name": region_parent_name,
+        "listing_by": rng.choice(np.array(LISTING_BY, dtype=object), rows),
+        "time_on_jiji": time_on_jiji,
+        "seller_or_agent_name": pd.Series(rng.integers(0, max(rows // 40, 1), rows)).map("Seller {}".format),
+        "property_use": rng.choice(np.array(PROPERTY_USE, dtype=object), rows),
+        "images_count": rng.integers(0, 20, rows),
+        "is_boost": rng.random(rows) < 0.1,
+        "badge_label": rng.choice(np.array(["", "TOP", "Verified"], dtype=object), rows),
+    })
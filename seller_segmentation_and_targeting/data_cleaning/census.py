@@ -0,0 +1,110 @@
+import re
+import pandas as pd
+
+# Census dimension columns and the listing columns they are joined in as
+CENSUS_COLUMNS = {
+    "density": "county_population_density(2019)",
+    "population": "county_population(2019)",
+    "male": "county_male_population(2019)",
+    "female": "county_female_population(2019)",
+    "intersex": "county_intersex_population(2019)",
+    "households": "county_households(2019)",
+    "conventional_households": "county_conventional_households(2019)",
+    "group_quarters": "county_group_quarters(2019)",
+    "land_area_sq_km": "county_land_area(sq_km)",
+}
+
+
+def normalize_county_name(name) -> str:
+    """Lowercases a county name and strips 'county', punctuation and repeated spaces."""
+    name = re.sub(r'\bcounty\b', '', str(name).lower())
+    name = re.sub(r'[^a-z0-9\s]', ' ', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+class CountyDimension:
+    """
+    The 2019 census figures as a county dimension table, keyed by census county name, with
+    the county names pre-normalized once so lookups and joins need no per-row regex work.
+    """
+
+    def __init__(self, population_parameters: dict):
+        rows = []
+        for census_county, values in (population_parameters or {}).items():
+            sex = values.get("Sex", {})
+            households = values.get("Households", {})
+            rows.append({
+                "census_county": census_county,
+                "density": values.get("Density (Persons per Sq. Km)"),
+                "population": values.get("Total"),
+                "male": sex.get("Male"),
+                "female": sex.get("Female"),
+                "intersex": sex.get("Intersex"),
+                "households": households.get("Total"),
+                "conventional_households": households.get("Conventional"),
+                "group_quarters": households.get("Group quarters"),
+                "land_area_sq_km": values.get("Land Area (Sq Km)"),
+            })
+        self.table = pd.DataFrame(rows, columns=["census_county", *CENSUS_COLUMNS]).set_index("census_county")
+        # (census name, normalized name, name with only punctuation replaced) in census order
+        self._keys = [
+            (key, normalize_county_name(key), re.sub(r'[^a-z0-9\s]', ' ', key.lower()))
+            for key in self.table.index
+        ]
+        self.aliases = {}
+
+    def match(self, county):
+        """
+        Finds the census county for a county value such as 'Nairobi', 'Nairobi City' or 'nairobi county'.
+
+        Returns:
+            str or None: The census county name, or None if nothing matches.
+        """
+        county_input = normalize_county_name(county)
+        # first pass: exact / substring two-way match
+        for key, key_norm, _ in self._keys:
+            if county_input == key_norm or county_input in key_norm or key_norm in county_input:
+                return key
+        # second pass: token (word) matching — pick first key that contains any token from input
+        for token in county_input.split():
+            for key, _, key_tokens in self._keys:
+                if token in key_tokens:
+                    return key
+        return None
+
+    def add_aliases(self, names):
+        """Resolves county names to census counties once and remembers the result."""
+        for name in names:
+            if name not in self.aliases:
+                self.aliases[name] = None if pd.isna(name) or str(name).strip() == "" else self.match(name)
+        return self.aliases
+
+    def enrich(self, df: pd.DataFrame, county_col: str = "county") -> pd.DataFrame:
+        """
+        Joins the census columns onto listings with a single indexed lookup on the resolved census county.
+
+        Args:
+            df (pd.DataFrame): Listings with a county column.
+            county_col (str): Name of the county column.
+
+        Returns:
+            pd.DataFrame: The listings with one column per entry of CENSUS_COLUMNS.
+        """
+        aliases = self.add_aliases(df[county_col].dropna().unique())
+        census_key = df[county_col].map(aliases)
+        census = self.table.rename(columns=CENSUS_COLUMNS).reindex(census_key.to_numpy())
+        census.index = df.index
+        df = df.drop(columns=[col for col in census.columns if col in df.columns])
+        return pd.concat([df, census], axis=1)
+
+
+_DIMENSIONS = {}
+
+
+def county_dimension(population_parameters: dict) -> CountyDimension:
+    """Returns the dimension table for a census dict, building it once per process."""
+    entry = _DIMENSIONS.get(id(population_parameters))
+    # The dict is kept in the entry so its id cannot be reused by another object
+    if entry is None or entry[0] is not population_parameters:
+        entry = _DIMENSIONS[id(population_parameters)] = (population_parameters, CountyDimension(population_parameters))
+    return entry[1]
@@ -0,0 +1,125 @@
+import argparse
+import glob
+import os
+import sys
+import time
+
+
+def find_inputs(patterns):
+    """Expands directories (every *.csv inside) and glob patterns into a sorted list of CSV paths."""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.update(glob.glob(os.path.join(pattern, "*.csv")))
+        else:
+            paths.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def timed_clean_file(path, destination, memory_budget, chunksize, schema=None):
+    """Runs pipeline.clean_file and returns the rows written with the seconds it took."""
+    from pipeline import clean_file
+
+    start = time.perf_counter()
+    rows = clean_file(path, destination, memory_budget, chunksize, schema)
+    return rows, time.perf_counter() - start
+
+
+def input_root(inputs):
+    """The deepest directory containing every input, which output paths are relative to."""
+    return os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in inputs])
+
+
+def output_path(path, root, output_dir, file_format):
+    """The output for an input, mirroring its directory below root so equal file names do not collide."""
+    relative = os.path.relpath(os.path.abspath(path), root)
+    return os.path.join(output_dir, f"{os.path.splitext(relative)[0]}.{file_format}")
+
+
+def duplicate_outputs(jobs):
+    """Output paths claimed by more than one input, e.g. listings.csv and listings.CSV."""
+    claimed = {}
+    for path, destination, *_ in jobs:
+        claimed.setdefault(os.path.normcase(destination), []).append(path)
+    return {destination: paths for destination, paths in claimed.items() if len(paths) > 1}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Clean Jiji land listing CSVs: read_dataset -> DataProcessor.process -> "
+                    "ExtractVariables.extract, one output file per input."
+    )
+    parser.add_argument("inputs", nargs="+", help="CSV files, directories of CSVs or glob patterns.")
+    parser.add_argument("-o", "--output-dir", required=True, help="Directory for the cleaned files.")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Files cleaned concurrently.")
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet", help="Output format (default: parquet).")
+    parser.add_argument("--memory-budget", type=int, help="Bytes per file above which a file is streamed in chunks.")
+    parser.add_argument("--chunksize", type=int, help="Rows per chunk when streaming.")
+    parser.add_argument("--all-columns", action="store_true",
+                        help="Read and keep every column with inferred dtypes instead of the pipeline's columns and dtypes.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # The pipeline pulls in pandas; import it only once the arguments are known to be valid
+    from pipeline import DEFAULT_CHUNKSIZE, worker_pool
+    from data_ingestion import pipeline_schema
+
+    inputs = find_inputs(args.inputs)
+    if not inputs:
+        print("No input CSV files found", file=sys.stderr)
+        return 2
+    chunksize = args.chunksize or DEFAULT_CHUNKSIZE
+    workers = max(1, min(args.workers, len(inputs)))
+    root = input_root(inputs)
+    schema = None if args.all_columns else pipeline_schema()
+    jobs = [
+        (path, output_path(path, root, args.output_dir, args.format), args.memory_budget, chunksize, schema)
+        for path in inputs
+    ]
+    duplicates = duplicate_outputs(jobs)
+    if duplicates:
+        for destination, paths in duplicates.items():
+            print(f"Inputs {', '.join(paths)} would all be written to {destination}", file=sys.stderr)
+        return 2
+    for _, destination, *_ in jobs:
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+
+    start = time.perf_counter()
+    results = {}
+    if workers == 1:
+        for job in jobs:
+            try:
+                results[job[0]] = (*timed_clean_file(*job), None)
+            except Exception as e:
+                results[job[0]] = (0, 0.0, e)
+    else:
+        with worker_pool(workers) as pool:
+            futures = {job[0]: pool.submit(timed_clean_file, *job) for job in jobs}
+            for path, future in futures.items():
+                try:
+                    results[path] = (*future.result(), None)
+                except Exception as e:
+                    results[path] = (0, 0.0, e)
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    for path, (rows, seconds, error) in results.items():
+        if error is None:
+            print(f"ok    {path}: {rows:,} rows in {seconds:.2f}s")
+        else:
+            failures += 1
+            print(f"FAIL  {path}: {type(error).__name__}: {error}", file=sys.stderr)
+    total_rows = sum(rows for rows, _, _ in results.values())
+    input_bytes = sum(os.path.getsize(path) for path in inputs)
+    print(
+        f"{len(inputs) - failures}/{len(inputs)} files, {total_rows:,} rows in {elapsed:.2f}s "
+        f"({total_rows / elapsed if elapsed else 0:,.0f} rows/s, {input_bytes / 2**20 / elapsed if elapsed else 0:.1f} MB/s input) "
+        f"with {workers} worker(s)"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,88 +1,95 @@
-import logging
-import logging.handlers
-import os
 import pandas as pd
-import re
 import numpy as np
 from utilities import Utilities
+from size_grammar import extract_sizes, rewrite_fraction, size_converter, size_pattern
+from evaluation import apply_values, source_text
+from census import normalize_county_name
+from instrumentation import record_stage_stats, run_stage
+from pipeline_logging import SampledLog, get_logger
 
-logger = logging.getLogger(__name__)
-LOG_LEVEL = "DEBUG"
-LOG_FILE = "data_cleaning.log"
+logger = get_logger(__name__)
 
-# Ensure the log file directory exists
-log_dir = os.path.dirname(LOG_FILE)
-if log_dir and not os.path.exists(log_dir):
-    os.makedirs(log_dir)
-
-# Set log level
-logger.setLevel(getattr(logging, LOG_LEVEL))
-
-# Custom formatter with detailed information
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - cleaner_and_processor.py : %(lineno)d-%(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
-console_handler.setFormatter(formatter)
-
-# Rotating file handler (size-based rotation, max 5MB per file, keep 5 backups)
-file_handler = logging.handlers.RotatingFileHandler(
-    LOG_FILE,
-    maxBytes=5 * 1024 * 1024,  # 5MB
-    backupCount=5
-)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(formatter)
-
-# Timed rotating file handler (rotates daily, keeps 7 days of logs)
-timed_file_handler = logging.handlers.TimedRotatingFileHandler(
-    LOG_FILE,
-    when='midnight',
-    interval=1,
-    backupCount=7
-)
-timed_file_handler.setLevel(logging.DEBUG)
-timed_file_handler.setFormatter(formatter)
-
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Text columns the size is searched in, in search order
+SIZE_SOURCE_COLUMNS = ['title', 'description', 'property_details']
+# Columns the county is matched from, in fallback order
+COUNTY_SOURCE_COLUMNS = ['region_name', 'region_parent_name', 'listing_by']
+# Backends process and extract can run on; "polars" needs the optional polars package
+BACKENDS = ("pandas", "polars")
 
 class DataProcessor:
+
+    def __init__(self, evaluate_unique: bool = True, instrumentation=None, memo=None):
+        """
+        Args:
+            evaluate_unique (bool): Run per-value transforms once per distinct value instead of once per row.
+            instrumentation (Instrumentation, optional): Records timings and row counts for each stage of process.
+            memo (MemoStore, optional): Persistent memo of size and acreage by source text; only
+                texts it does not hold yet are parsed.
+        """
+        self.evaluate_unique = evaluate_unique
+        self.instrumentation = instrumentation
+        self.memo = memo
     
     @staticmethod
-    def extract_and_fill_size(df: pd.DataFrame) -> pd.DataFrame:
+    def size_source_text(df: pd.DataFrame) -> pd.Series:
+        """
+        The text the size is searched in: the normalized 'title', 'description' and
+        'property_details' of each row, joined by two spaces with empty fields skipped.
+        """
+        def normalize_column(col):
+            text = df[col].astype(object).where(df[col].notna(), "nan").astype(str)
+            return (
+                text.str.replace('Â', 'A', regex=False)
+                .str.replace('×', 'x', regex=False)
+                .str.replace('\n', ' ', regex=False)
+                .str.strip()
+            )
+        combined_text = None
+        for col in SIZE_SOURCE_COLUMNS:
+            text = normalize_column(col)
+            if combined_text is None:
+                combined_text = text
+                continue
+            # Empty fields are skipped by the join, so only separate two non-empty parts
+            separator = pd.Series(
+                np.where((combined_text != "") & (text != ""), "  ", ""), index=df.index
+            )
+            combined_text = combined_text + separator + text
+        return combined_text
+
+    @staticmethod
+    def extract_and_fill_size(df: pd.DataFrame, engine: str = "anchored") -> pd.DataFrame:
         """
         Extracts property size information from text fields and populates a new 'size' column in the DataFrame.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame with 'title', 'description' and 'property_details' columns.
+            engine (str): "anchored" builds the combined text like "vectorized", rejects rows without
+                a unit anchor and runs the grammar only from the first anchor's window (see
+                size_grammar.extract_sizes); "vectorized" normalizes and joins the text columns with
+                pandas string operations and runs a single Series.str.extract pass; "apply"
+                searches row by row. All keep the first match in the combined text.
         """
-        pattern = re.compile(
-            r"(?:"  # Non-capturing group for all patterns
-            r"(?<!\w)(?:quarter|half|one?|two|three*?|four|for(t(h)?)?|five|fif(t(h)?)?|six(t(h)?)?|seven(t(h)?s?)?|eigh(t(h)?)?|nine(t(h)?)?|ten(t(h)?s?)?|eleven|twelve|thirteen|fourteen|fifteen|twenty|thirty|forty|fifty)(?:th|rd|nd|s)?\s*(?:an\s+)?(?:acre|acres|ac|acr|acrs)(?!\w)|"  # Written numbers
-            r"(?<!\w)(?:[Qq]uarter|[Hh]alf|[Oo]ne|[Tt]wo|[Tt]hree|[Ff]our|[Ff]or(t(h)?)?|[Ff]ive|[Ff]if(t(h)?)?|[Ss]ix(t(h)?)?|[Ss]even(t(h)?s?)?|[Ee]igh(t(h)?)?|[Nn]ine(t(h)?)?|[Tt]en(t(h)?s?)?|[Ee]leven|[Tt]welve|[Tt]hirteen|[Ff]ourteen|[Ff]ifteen|[Tt]wenty|[Tt]hirty|[Ff]orty|[Ff]ifty)(?:th|rd|nd|s)?\s*(?:an\s+)?(?:[Aa]cre|[Aa]cres|ac|acr|acrs)(?!\w)|"  # Capitalized written numbers
-            r"\b(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:acres?|ac|acr|acrs|ha|hectares?)\b|"  # Numeric acres/hectares with commas
-            r"\b(\d{1,3}(?:,\d{3})*(?:\.\d+)?)-(?:[Aa]cre|[Aa]cres|ac|acr|acrs|ha|[Hh]ectares?)\b|"  # Hyphenated numeric acres with commas
-            r"\b\d+\.?\d*\s*(?:[x*×#/-]|by)\s*\d+\.?\d*\s*(?:ft|feet|fts|m)?\b|"  # Dimensions
-            r"\b\d+/\d+\s*th\s*(?:acre|acres|ac|acr|acrs)\b|"  # Fractions with 'th'
-            r"\b\d+/\d+\s*(?:acre|acres|ac|acr|acrs)\b|"  # Fractions without 'th'
-            r"\b\d+\s*/\s*(?:acre|acres|ac|acr|acrs)\b|"  # Price per acre
-            r"\b(?:slightly\s+more\s+than\s+a\s+quarter)\s*(?:acre|acres|ac|acr|acrs)\b|"  # Edge case
-            r"\b\d+\s*ft\s*\*\s*\d+\s*ft\b|"  # Specific ft format
-            r"\bNumber\s+of\s+plots\s*:\s*\d+\b"  # Number of plots
-            r")"
-        )
+        if engine not in ("anchored", "vectorized", "apply"):
+            raise ValueError(f"Unknown size extraction engine: {engine!r}")
         try:
-            search_columns = ['title', 'description', 'property_details']
+            search_columns = SIZE_SOURCE_COLUMNS
             def normalize_text(text):
                 return str(text).replace('Â', 'A').replace('×', 'x').replace('\n', ' ').strip()
             def extract_match(row):
                 combined_text = "  ".join(normalize_text(row[col]) for col in search_columns if normalize_text(row[col]))
-                match = pattern.search(combined_text)
+                match = size_pattern().search(combined_text)
                 return match[0] if match else np.nan
-            df['size'] = df.apply(extract_match, axis=1)
+            if engine == "apply":
+                df['size'] = df.apply(extract_match, axis=1)
+            elif engine == "anchored":
+                df['size'], rejected = extract_sizes(DataProcessor.size_source_text(df))
+                reject_rate = rejected / len(df) if len(df) else 0.0
+                record_stage_stats(anchor_rejected_rows=rejected, anchor_reject_rate=reject_rate)
+                logger.info(f"Size anchor scan rejected {rejected} of {len(df)} rows ({reject_rate:.1%})")
+            else:
+                combined_text = DataProcessor.size_source_text(df)
+                df['size'] = combined_text.str.extract(size_pattern(), expand=False)
             df.dropna(subset=["size"], inplace=True)
             logger.info("Success. Size fields extracted and filled")
             return df
@@ -92,155 +99,13 @@ class DataProcessor:
             raise e
         
     @staticmethod 
-    def convert_to_acreage(df: pd.DataFrame) -> pd.DataFrame:
+    def convert_to_acreage(df: pd.DataFrame, evaluate_unique: bool = True) -> pd.DataFrame:
         """
         Converts the 'size' column in the DataFrame to acres and populates a new 'acreage' column.
+        Each value is matched once against the shared size grammar and converted by the branch that fired.
         """
-        pattern = re.compile(
-            r"(?:"  # Non-capturing group for all patterns
-            r"(?<!\w)(?:quarter|half|one?|two|three*?|four|for(t(h)?)?|five|fif(t(h)?)?|six(t(h)?)?|seven(t(h)?s?)?|eigh(t(h)?)?|nine(t(h)?)?|ten(t(h)?s?)?|eleven|twelve|thirteen|fourteen|fifteen|twenty|thirty|forty|fifty)(?:th|rd|nd|s)?\s*(?:an\s+)?(?:acre|acres|ac|acr|acrs)(?!\w)|"  # Written numbers
-            r"(?<!\w)(?:[Qq]uarter|[Hh]alf|[Oo]ne|[Tt]wo|[Tt]hree|[Ff]our|[Ff]or(t(h)?)?|[Ff]ive|[Ff]if(t(h)?)?|[Ss]ix(t(h)?)?|[Ss]even(t(h)?s?)?|[Ee]igh(t(h)?)?|[Nn]ine(t(h)?)?|[Tt]en(t(h)?s?)?|[Ee]leven|[Tt]welve|[Tt]hirteen|[Ff]ourteen|[Ff]ifteen|[Tt]wenty|[Tt]hirty|[Ff]orty|[Ff]ifty)(?:th|rd|nd|s)?\s*(?:an\s+)?(?:[Aa]cre|[Aa]cres|ac|acr|acrs)(?!\w)|"  # Capitalized written numbers
-            r"\b(\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?:acres?|ac|acr|acrs|ha|hectares?)\b|"  # Numeric acres/hectares with commas
-            r"\b(\d{1,3}(?:,\d{3})*(?:\.\d+)?)-(?:[Aa]cre|[Aa]cres|ac|acr|acrs|ha|[Hh]ectares?)\b|"  # Hyphenated numeric acres with commas
-            r"\b\d+\.?\d*\s*(?:[x*×#/-]|by)\s*\d+\.?\d*\s*(?:ft|feet|fts|m)?\b|"  # Dimensions
-            r"\b\d+/\d+\s*th\s*(?:acre|acres|ac|acr|acrs)\b|"  # Fractions with 'th'
-            r"\b\d+/\d+\s*(?:acre|acres|ac|acr|acrs)\b|"  # Fractions without 'th'
-            r"\b\d+\s*/\s*(?:acre|acres|ac|acr|acrs)\b|"  # Price per acre
-            r"\b(?:slightly\s+more\s+than\s+a\s+quarter)\s*(?:acre|acres|ac|acr|acrs)\b|"  # Edge case
-            r"\b\d+\s*ft\s*\*\s*\d+\s*ft\b|"  # Specific ft format
-            r"\bNumber\s+of\s+plots\s*:\s*\d+\b"  # Number of plots
-            r")"
-        )
-
-        def parse_written_number(text):
-            """Parse written numbers from 1 to 1000."""
-            written_numbers = {
-                'quarter': 0.25, 'half': 0.5, 'on': 1, 'one': 1.0, 'two': 2.0, 'three': 3.0, 'four': 4.0,
-                'five': 5.0, 'six': 6.0, 'seven': 7.0, 'eight': 8.0, 'eighth': 0.125, 'nine': 9.0,
-                'ten': 10.0, 'eleven': 11.0, 'twelve': 12.0, 'thirteen': 13.0, 'fourteen': 14.0,
-                'fifteen': 15.0, 'sixteen': 16.0, 'seventeen': 17.0, 'eighteen': 18.0, 'nineteen': 19.0,
-                'twenty': 20.0, 'thirty': 30.0, 'forty': 40.0, 'fifty': 50.0, 'sixty': 60.0,
-                'seventy': 70.0, 'eighty': 80.0, 'ninety': 90.0
-            }
-            hundreds = {f'{n} hundred': i * 100.0 for i, n in enumerate(['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine'], start=0)}
-
-            text = text.lower().replace(' an ', ' ').replace(' and ', ' ').strip()
-            text = re.sub(r'(?:th|rd|nd|s)?\s*(?:acre|acres|ac|acr|acrs)\b', '', text).strip()
-
-            if text in written_numbers:
-                return written_numbers[text]
-            if text in hundreds:
-                return hundreds[text]
-
-            decimal_match = re.match(r'^\d+\.\d+$', text)
-            if decimal_match:
-                return float(text)
-
-            parts = text.split()
-            total = 0.0
-            if len(parts) > 1 and parts[1] == 'hundred':
-                hundreds_value = hundreds.get(f'{parts[0]} hundred', 0.0)
-                total += hundreds_value
-                if len(parts) > 2:
-                    remainder = ' '.join(parts[2:])
-                    if remainder in written_numbers:
-                        total += written_numbers[remainder]
-                    else:
-                        tens_part = parts[2] if len(parts) > 2 else ''
-                        units_part = parts[3] if len(parts) > 3 else ''
-                        tens = written_numbers.get(tens_part, 0.0)
-                        units = written_numbers.get(units_part, 0.0)
-                        total += tens + units
-            elif text in [f'{t} {u}' for t in ['twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety']
-                        for u in ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']]:
-                tens, units = text.split()
-                total = written_numbers.get(tens, 0.0) + written_numbers.get(units, 0.0)
-            
-            return float(total) if total > 0 else None
-
-        def map_to_acres(size):
-            if pd.isna(size):
-                return np.nan
-            
-            text = str(size).lower().strip()
-            match = pattern.search(text)
-            if not match:
-                return np.nan
-            
-            matched_text = match.group(0).lower()
-
-            # Fractions (e.g., "1/4 acre", "1/8th ac")
-            fraction_match = re.match(r'\b(\d+)/(\d+)\s*(?:th)?\s*(?:acre|acres|ac|acr|acrs)\b', matched_text, re.IGNORECASE)
-            if fraction_match:
-                num, denom = map(int, fraction_match.groups())
-                return float(num) / denom
-
-            # Written numbers, fractions, or decimals
-            written_match = re.match(r'(?<!\w)(\d+/\d+|\d+\.\d+|quarter|half|one*?|two|three*?|four|five|six|seven|eigh(?:t|th)|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety|(?:one|two|three|four|five|six|seven|eight|nine)\s+hundred(?:\s*(?:twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)?(?:\s*(?:one|two|three|four|five|six|seven|eight|nine))?)?)(?:th|rd|nd|s)?\s*(?:an\s+)?(?:acre|acres|ac|acr|acrs)(?!\w)', matched_text, re.IGNORECASE)
-            if written_match:
-                parsed_value = parse_written_number(written_match.group(1))
-                if parsed_value is not None:
-                    return parsed_value
-
-            fraction = {
-                '650 / acre': 650,
-                '1/2': 0.5, '1/2acre': 0.5, '1/2 acre': 0.5, '1/2-acre': 0.5, '1/2acres': 0.5, '1/2 acres': 0.5, '1/2-acres': 0.5,
-                '1/4': 0.25, '1/4acre': 0.25, '1/4 acre': 0.25, '1/4-acre': 0.25, '1/4acres': 0.25, '1/4 acres': 0.25, '1/4-acres': 0.25,
-                '1/8': 0.125, '1/8acre': 0.125, '1/8 acre': 0.125, '1/8-acre': 0.125, '1/8acres': 0.125, '1/8 acres': 0.125, '1/8-acres': 0.125,
-                '1/3': 0.3333, '1/3acre': 0.3333, '1/3 acre': 0.3333, '1/3-acre': 0.3333, '1/3acres': 0.3333, '1/3 acres': 0.3333, '1/3-acres': 0.3333,
-                '2/3': 0.6667, '2/3acre': 0.6667, '2/3 acre': 0.6667, '2/3-acre': 0.6667, '2/3acres': 0.6667, '2/3 acres': 0.6667, '2/3-acres': 0.6667,
-                '3/4': 0.75, '3/4acre': 0.75, '3/4 acre': 0.75, '3/4-acre': 0.75, '3/4acres': 0.75, '3/4 acres': 0.75, '3/4-acres': 0.75,
-                '5/8': 0.625, '5/8acre': 0.625, '5/8 acre': 0.625, '5/8-acre': 0.625, '5/8acres': 0.625, '5/8 acres': 0.625, '5/8-acres': 0.625,
-                '7/8': 0.875, '7/8acre': 0.875, '7/8 acre': 0.875, '7/8-acre': 0.875, '7/8acres': 0.875, '7/8 acres': 0.875, '7/8-acres': 0.875,
-                '1/5': 0.2, '1/5acre': 0.2, '1/5 acre': 0.2, '1/5-acre': 0.2, '1/5acres': 0.2, '1/5 acres': 0.2, '1/5-acres': 0.2,
-                '2/5': 0.4, '2/5acre': 0.4, '2/5 acre': 0.4, '2/5-acre': 0.4, '2/5acres': 0.4, '2/5 acres': 0.4, '2/5-acres': 0.4,
-                '3/5': 0.6, '3/5acre': 0.6, '3/5 acre': 0.6, '3/5-acre': 0.6, '3/5acres': 0.6, '3/5 acres': 0.6, '3/5-acres': 0.6,
-                '4/5': 0.8, '4/5acre': 0.8, '4/5 acre': 0.8, '4/5-acre': 0.8, '4/5acres': 0.8, '4/5 acres': 0.8, '4/5-acres': 0.8,
-                '1/6': 0.1667, '1/6acre': 0.1667, '1/6 acre': 0.1667, '1/6-acre': 0.1667, '1/6acres': 0.1667, '1/6 acres': 0.1667, '1/6-acres': 0.1667,
-                '5/6': 0.8333, '5/6acre': 0.8333, '5/6 acre': 0.8333, '5/6-acre': 0.8333, '5/6acres': 0.8333, '5/6 acres': 0.8333, '5/6-acres': 0.8333,
-                '1/10': 0.1, '1/10acre': 0.1, '1/10 acre': 0.1, '1/10-acre': 0.1, '1/10acres': 0.1, '1/10 acres': 0.1, '1/10-acres': 0.1,
-                '9/10': 0.9, '9/10acre': 0.9, '9/10 acre': 0.9, '9/10-acre': 0.9, '9/10acres': 0.9, '9/10 acres': 0.9, '9/10-acres': 0.9,
-                '3/8': 0.375, '3/8acre': 0.375, '3/8 acre': 0.375, '3/8-acre': 0.375, '3/8acres': 0.375, '3/8 acres': 0.375, '3/8-acres': 0.375
-            }
-
-            for key in fraction:
-                if key in matched_text: return fraction[key]
-
-            # Numeric acres (e.g., "27000 acres", "1000 acres", "3.5 acres")
-            numeric_match = re.match(r'\b(\d+\.?\d*)\s*(?:acres?|ac|acr|acrs)\b', matched_text, re.IGNORECASE)
-            if numeric_match:
-                return float(numeric_match.group(1))
-
-            # Hyphenated numeric acres (e.g., "27000-Acre", "1.25-Acre")
-            hyphen_match = re.match(r'\b(\d+\.?\d*)\s*-?(?:[Aa]cre|[Aa]cres|ac|acr|acrs)\b', matched_text, re.IGNORECASE)
-            if hyphen_match:
-                return float(hyphen_match.group(1))
-
-            # Hectares (e.g., "0.05 ha")
-            hectare_match = re.match(r'\b(\d+\.?\d*)\s*-?(?:ha|hectares?)\b', matched_text, re.IGNORECASE)
-            if hectare_match:
-                return float(hectare_match.group(1)) * 2.471
-
-            # Dimensions (e.g., "50x100 ft", "40 by 80")
-            dim_match = re.match(r'\b(\d+\.?\d*)\s*(?:[x*×#/-]|by)\s*(\d+\.?\d*)\s*(?:ft|feet|fts|m)?\b', matched_text, re.IGNORECASE)
-            if dim_match:
-                length, width = map(float, dim_match.groups())
-                return (length * width) / 43560.0
-
-            # Specific ft format (e.g., "50 ft * 100 ft")
-            ft_match = re.match(r'\b(\d+)\s*ft\s*\*\s*(\d+)\s*ft\b', matched_text, re.IGNORECASE)
-            if ft_match:
-                length, width = map(float, ft_match.groups())
-                return (length * width) / 43560.0
-
-            # Edge case: "slightly more than a quarter acre"
-            if re.match(r'\b(?:slightly\s+more\s+than\s+a\s+quarter)\s*(?:acre|acres|ac|acr|acrs)\b', matched_text, re.IGNORECASE):
-                return 0.25
-
-            return np.nan 
-
         try:
-            df['acreage'] = df['size'].apply(map_to_acres)
+            df['acreage'] = apply_values(df['size'], size_converter(), unique=evaluate_unique)
             logger.info("Successfully created 'acreage' column with converted values")
             df.dropna(subset=['acreage'], inplace=True)
             return df
@@ -253,60 +118,105 @@ class DataProcessor:
         """
         Cleans a price DataFrame by removing the 'price_view' column (if it exists) 
         and renaming the 'price' column to 'price_in_KES'. Calculates price_per_acre(KES).
+
+        Prices quoted 'per Acre' are already per acre; other prices are divided by the acreage,
+        and rows with missing or non-positive acreage get NaN. Frames without a price column
+        are returned without price_per_acre(KES).
         """
         try:
             if 'price_view' in df.columns:
                 df = df.drop(columns='price_view')
+            if 'price' in df.columns:
                 df.rename(columns={'price': 'price_in_KES'}, inplace=True)
-                df['price_per_acre(KES)'] = df.apply(
-                    lambda row: np.nan if pd.isna(row['acreage']) or row['acreage'] <= 0 
-                    else row['price_in_KES'] / row['acreage'] if pd.isna(row['price_period']) or row['price_period'].strip() != 'per Acre' 
-                    else row['price_in_KES'],
-                    axis=1
-                )
-                logger.info("Cleaning Success !! price_view_col dropped, price column cleaned")
+            if 'price_in_KES' not in df.columns:
+                logger.info("No price column, price_per_acre(KES) not calculated")
+                return df
+            price = df['price_in_KES'].to_numpy(dtype=float, na_value=np.nan)
+            acreage = df['acreage'].to_numpy(dtype=float, na_value=np.nan)
+            per_acre = np.zeros(len(df), dtype=bool)
+            if 'price_period' in df.columns:
+                period = df['price_period'].astype(object).where(df['price_period'].notna(), "").astype(str)
+                per_acre = (period.str.strip() == 'per Acre').to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                price_per_acre = np.where(per_acre, price, price / acreage)
+            df['price_per_acre(KES)'] = np.where(acreage > 0, price_per_acre, np.nan)
+            logger.info("Cleaning Success !! price_view_col dropped, price column cleaned")
             return df
         except Exception as e:
             logger.error("Error!! Failed to clean price columns")
             raise e
     
     @staticmethod
-    def enhanced_fraction_parsing(df: pd.DataFrame) -> pd.DataFrame:
+    def enhanced_fraction_parsing(df: pd.DataFrame, evaluate_unique: bool = True) -> pd.DataFrame:
         """
         Preprocesses the 'size' column to handle fraction formats like '1/8acre'.
         """
         try:
-            fraction_pattern = re.compile(
-                r'\b(\d+)/(\d+)(?:\s*th)?(?:\s*|-)?(?:acre|acres|ac|acr|acrs)\b',
-                re.IGNORECASE
-            )
-            
             def preprocess_size(size):
                 if pd.isna(size):
                     return size
-                text = str(size).lower().strip()
-                match = fraction_pattern.search(text)
-                if match:
-                    num, denom = map(int, match.groups())
-                    return f"{num}/{denom} acre"
-                return size
+                return rewrite_fraction(size)
 
-            df['size'] = df['size'].apply(preprocess_size)
+            df['size'] = apply_values(df['size'], preprocess_size, unique=evaluate_unique)
             logger.info("Successfully preprocessed 'size' column for enhanced fraction parsing")
             return df
         except Exception as e:
             logger.error(f"Error preprocessing size column for fractions: {str(e)}")
             raise e
 
-    def process(self, df: pd.DataFrame) -> pd.DataFrame:
+    def parse_size(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Runs size extraction, fraction rewriting and acreage conversion on a DataFrame."""
+        df = self.extract_and_fill_size(df)
+        df = self.enhanced_fraction_parsing(df, self.evaluate_unique)
+        return self.convert_to_acreage(df, self.evaluate_unique)
+
+    def memoized_size(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills 'size' and 'acreage' from the memo store, parsing only the source texts it does not
+        hold yet, and drops rows without an acreage as the unmemoized stages do.
+        """
+        try:
+            def compute(positions):
+                rows = df.iloc[positions][SIZE_SOURCE_COLUMNS].copy()
+                rows.index = positions
+                return self.parse_size(rows)
+            values = self.memo.memoize("size", self.size_source_text(df), ["size", "acreage"], compute)
+            df['size'] = values['size']
+            df['acreage'] = values['acreage'].astype(float)
+            df.dropna(subset=['size', 'acreage'], inplace=True)
+            return df
+        except Exception as e:
+            logger.error(f"Error filling memoized sizes: {str(e)}")
+            raise e
+
+    def process(self, df: pd.DataFrame, backend: str = "pandas") -> pd.DataFrame:
         """
         Processes the input DataFrame through all steps.
+
+        Args:
+            df (pd.DataFrame): Raw listings.
+            backend (str): "pandas" runs the stages below; "polars" runs the same stages as one
+                Polars lazy query (see polars_backend.process_frame), without the memo store.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
         try:
-            df = self.extract_and_fill_size(df)
-            df = self.enhanced_fraction_parsing(df)
-            df = self.convert_to_acreage(df)
-            df = self.clean_price(df)
+            if backend == "polars":
+                from polars_backend import process_frame
+                df = run_stage(self.instrumentation, "DataProcessor", "polars_process", process_frame, df)
+                logger.info("Successfully processed DataFrame through all steps with polars")
+                return df
+            if self.memo is None:
+                stages = [
+                    ("extract_and_fill_size", self.extract_and_fill_size),
+                    ("enhanced_fraction_parsing", lambda df: self.enhanced_fraction_parsing(df, self.evaluate_unique)),
+                    ("convert_to_acreage", lambda df: self.convert_to_acreage(df, self.evaluate_unique)),
+                ]
+            else:
+                stages = [("memoized_size", self.memoized_size)]
+            stages.append(("clean_price", self.clean_price))
+            for stage, func in stages:
+                df = run_stage(self.instrumentation, "DataProcessor", stage, func, df)
         
             logger.info("Successfully processed DataFrame through all steps")
             return df
@@ -320,8 +230,22 @@ class DataProcessor:
 class ExtractVariables(Utilities):
     """This is a class that helps extract features from text descriptions, such as nearness to the road, county, etc."""
     
-    def __init__(self):
+    def __init__(self, evaluate_unique: bool = True, instrumentation=None, memo=None):
+        """
+        Args:
+            evaluate_unique (bool): Run per-value transforms once per distinct value instead of once per row.
+            instrumentation (Instrumentation, optional): Records timings and row counts for each stage of extract.
+            memo (MemoStore, optional): Persistent memo of county and years_on_jiji by source text;
+                only texts it does not hold yet are matched or parsed.
+        """
         super().__init__()
+        self.evaluate_unique = evaluate_unique
+        self.instrumentation = instrumentation
+        self.memo = memo
+        self.gazetteer = self.store.automaton
+        self.county_dimension = self.store.dimension
+        # get_county_population_density runs per row, so its miss records are sampled
+        self.density_misses = SampledLog(logger)
     
     def get_county(self, region):
         """
@@ -335,10 +259,8 @@ class ExtractVariables(Utilities):
         """
         if not region or pd.isna(region):
             return np.nan
-        for county, locations in self.get_kenyan_counties().items():
-            if any(loc.lower() in str(region).lower() for loc in locations):
-                return county
-        return np.nan
+        county = self.store.find_county(str(region).lower())
+        return np.nan if county is None else county
     
     def get_county_population_density(self, county_col):
         """
@@ -349,59 +271,126 @@ class ExtractVariables(Utilities):
             if pd.isna(county_col) or str(county_col).strip() == "":
                 return np.nan
 
-            # normalize input
-            county_input = str(county_col).lower()
-            county_input = re.sub(r'\bcounty\b', '', county_input)        # remove "county"
-            county_input = re.sub(r'[^a-z0-9\s]', ' ', county_input)     # remove punctuation
-            county_input = re.sub(r'\s+', ' ', county_input).strip()
-
-            pop_params = self.population_parameters or {}
-            # first pass: exact / substring two-way match
-            for key, val in pop_params.items():
-                key_norm = key.lower()
-                key_norm = re.sub(r'\bcounty\b', '', key_norm)
-                key_norm = re.sub(r'[^a-z0-9\s]', ' ', key_norm)
-                key_norm = re.sub(r'\s+', ' ', key_norm).strip()
-
-                if county_input == key_norm or county_input in key_norm or key_norm in county_input:
-                    return val.get("Density (Persons per Sq. Km)", np.nan)
-
-            # second pass: token (word) matching — pick first key that contains any token from input
-            tokens = county_input.split()
-            for token in tokens:
-                for key, val in pop_params.items():
-                    if token and token in re.sub(r'[^a-z0-9\s]', ' ', key.lower()):
-                        return val.get("Density (Persons per Sq. Km)", np.nan)
-
-            logger.debug(f"No population-density match for county value: '{county_col}' (normalized '{county_input}')")
-            return np.nan
+            census_county = self.store.census_county(county_col)
+            if census_county is None:
+                if self.density_misses.allow():
+                    logger.debug(
+                        f"No population-density match for county value: '{county_col}' (normalized '{normalize_county_name(county_col)}'),"
+                        f" {self.density_misses.suppressed} similar records suppressed"
+                    )
+                return np.nan
+            return self.store.density(census_county)
 
         except Exception as e:
             logger.error(f"Error retrieving density for {county_col}: {e}")
             return np.nan
     
     @staticmethod
-    def clean_time_on_jiji(time_on_jiji_col):
+    def parse_time_on_jiji(time_on_jiji: pd.Series, evaluate_unique: bool = True) -> pd.Series:
+        """
+        Converts values like '1 year, 2 months' into fractional years with one str.extract per
+        component.
+
+        The column only holds a few hundred distinct durations, so by default it is factorized
+        and the extraction runs over the distinct values before being mapped back to every row.
+
+        Args:
+            time_on_jiji (pd.Series): The time_on_jiji column.
+            evaluate_unique (bool): Extract once per distinct value instead of once per row.
+
+        Returns:
+            pd.Series: Years on Jiji as floats. Missing and non-string values give NaN, as does
+                a year or month marker without a number in front of it.
+        """
         try:
-            years_pattern = re.compile(r'\d*\s*y')
-            months_pattern = re.compile(r'\d*\s*m', re.I)
-            
-            y_match = re.search(years_pattern, time_on_jiji_col)
-            if y_match:
-                years = int(str(y_match.group(0).split(" ")[0]))
-            else: 
-                years = 0
-            m_match = re.search(months_pattern, time_on_jiji_col)
-            if m_match:
-                months = float(str(m_match.group(0).split(" ")[0]))
+            if evaluate_unique:
+                codes, uniques = pd.factorize(time_on_jiji.astype(object))
+                # Missing values are coded -1 and pick up the trailing NaN
+                values = np.append(ExtractVariables._fractional_years(uniques), np.nan)[codes]
             else:
-                months = 0
-            return years + float(months/12)
+                values = ExtractVariables._fractional_years(time_on_jiji.to_numpy(dtype=object))
+            return pd.Series(values, index=time_on_jiji.index, name=time_on_jiji.name)
         except Exception as e:
             logger.error("Error while cleaning the column time on jiji")
             raise e
-            
 
+    @staticmethod
+    def _fractional_years(values: np.ndarray) -> np.ndarray:
+        years_on_jiji = np.full(len(values), np.nan)
+        try:
+            text = pd.Series(values, dtype=object).str
+        except AttributeError:
+            # A column without any strings, e.g. all numbers
+            return years_on_jiji
+
+        def component(pattern):
+            digits = text.extract(pattern, expand=False)
+            # No match counts as zero, while a match without digits cannot be read
+            value = pd.to_numeric(digits, errors='coerce')
+            return value.where(digits.notna(), 0.0)
+
+        years = component(r'(\d*)\s*y')
+        months = component(r'(?i)(\d*)\s*m')
+        return (years + months / 12).where(text.len().notna()).to_numpy(dtype=float)
+
+
+    def find_counties(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Matches the county of each row from 'region_name', falling back to the region, parent region
+        and lister names combined for rows where the region name alone matches no county.
+        """
+        # First attempt: Extract county from 'region_name'
+        county = apply_values(df['region_name'], self.get_county, unique=self.evaluate_unique)
+
+        # For rows where county is still NaN, try combining other columns
+        mask = county.isna()
+        if mask.any():
+            columns = [col for col in COUNTY_SOURCE_COLUMNS if col in df.columns]
+            rows = df.loc[mask, columns]
+            combined = pd.Series("", index=rows.index, dtype=object)
+            started = pd.Series(False, index=rows.index)
+            for col in columns:
+                present = rows[col].notna()
+                text = rows[col].astype(object).where(present, "").astype(str)
+                combined = combined + np.where(started & present, " ", "") + text
+                started = started | present
+            # county is all-NaN float64 when no region name matched, which cannot take strings
+            county = county.astype(object)
+            county[mask] = apply_values(combined, self.get_county, unique=self.evaluate_unique)
+            county = county.infer_objects()
+        return county
+
+    def extract_county(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds a 'county' column matched by find_counties, through the memo store when one is set."""
+        if self.memo is None:
+            df['county'] = self.find_counties(df)
+            return df
+        columns = [col for col in COUNTY_SOURCE_COLUMNS if col in df.columns]
+        def compute(positions):
+            rows = df.iloc[positions][columns]
+            rows.index = positions
+            return self.find_counties(rows).rename('county').to_frame()
+        df['county'] = self.memo.memoize("county", source_text(df, columns), ['county'], compute)['county']
+        return df
+
+    def add_census_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Joins the 2019 census figures for each listing's county."""
+        return self.county_dimension.enrich(df)
+
+    def add_years_on_jiji(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replaces 'time_on_jiji' with the fractional 'years_on_jiji'."""
+        time_on_jiji = df['time_on_jiji']
+        if self.memo is None:
+            df["years_on_jiji"] = self.parse_time_on_jiji(time_on_jiji, self.evaluate_unique)
+        else:
+            def compute(positions):
+                values = time_on_jiji.iloc[positions]
+                values.index = positions
+                return self.parse_time_on_jiji(values, self.evaluate_unique).rename('years_on_jiji').to_frame()
+            years = self.memo.memoize("years_on_jiji", source_text(df, ['time_on_jiji']), ['years_on_jiji'], compute)
+            df["years_on_jiji"] = years['years_on_jiji'].astype(float)
+        df.drop(columns= ['time_on_jiji'], inplace= True)
+        return df
 
     def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -411,26 +400,13 @@ class ExtractVariables(Utilities):
             df (pd.DataFrame): Input DataFrame containing region-related columns.
         
         Returns:
-            pd.DataFrame: DataFrame with a new 'county' column.
+            pd.DataFrame: DataFrame with new 'county', county census and 'years_on_jiji' columns.
         """
         try:
-            # First attempt: Extract county from 'region_name'
-            df['county'] = df['region_name'].apply(self.get_county)
-    
-            # For rows where county is still NaN, try combining other columns
-            mask = df['county'].isna()
-            if mask.any():
-                def combine_columns(row):
-                    columns = ['region_name', 'region_parent_name', 'listing_by']
-                    text = ' '.join(str(row[col]) for col in columns if col in df.columns and pd.notna(row[col]))
-                    return self.get_county(text)
-                
-                df.loc[mask, 'county'] = df[mask].apply(combine_columns, axis=1)
-                
-            df['county_population_density(2019)'] = df['county'].apply(self.get_county_population_density)
+            df = run_stage(self.instrumentation, "ExtractVariables", "extract_county", self.extract_county, df)
+            df = run_stage(self.instrumentation, "ExtractVariables", "add_census_columns", self.add_census_columns, df)
             logger.info("Successfully extracted county information")
-            df["years_on_jiji"] = df['time_on_jiji'].apply(self.clean_time_on_jiji)
-            df.drop(columns= ['time_on_jiji'], inplace= True)
+            df = run_stage(self.instrumentation, "ExtractVariables", "add_years_on_jiji", self.add_years_on_jiji, df)
             logger.info("Successfully extracted and cleaned time on jiji")
             return df
         except Exception as e:
@@ -438,18 +414,27 @@ class ExtractVariables(Utilities):
             raise e
     
     
-    def extract(self, df: pd.DataFrame) -> pd.DataFrame:
+    def extract(self, df: pd.DataFrame, backend: str = "pandas") -> pd.DataFrame:
         """
         Processes the input DataFrame by applying feature extraction.
         
         Args:
             df (pd.DataFrame): Input DataFrame.
+            backend (str): "pandas" or "polars", which runs county lookup, the census join and
+                time-on-Jiji parsing as one Polars lazy query (see polars_backend.extract_frame).
         
         Returns:
             pd.DataFrame: Processed DataFrame with extracted features.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
         try:
-            df = self._apply(df)
+            if backend == "polars":
+                from polars_backend import extract_frame
+                df = run_stage(self.instrumentation, "ExtractVariables", "polars_extract",
+                               lambda df: extract_frame(df, self.store), df)
+            else:
+                df = self._apply(df)
             logger.info("Successfully processed DataFrame in ExtractVariables")
             return df
         except Exception as e:
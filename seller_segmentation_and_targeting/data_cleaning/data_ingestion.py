@@ -1,75 +1,108 @@
-import logging
-import logging.handlers
-import os
+import time
 import pandas as pd
-from datetime import datetime# Logger configuration
-
-logger = logging.getLogger(__name__)
-LOG_LEVEL = "DEBUG"
-LOG_FILE = "data_cleaning.log"
-
-# Ensure the log file directory exists
-log_dir = os.path.dirname(LOG_FILE)
-if log_dir and not os.path.exists(log_dir):
-    os.makedirs(log_dir)
-
-# Set log level
-logger.setLevel(getattr(logging, LOG_LEVEL))
-
-# Custom formatter with detailed information
-
-formatter = logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - data_injestion.py:%(lineno)d - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
-console_handler.setFormatter(formatter)
-
-# Rotating file handler (size-based rotation, max 5MB per file, keep 5 backups)
-file_handler = logging.handlers.RotatingFileHandler(
-    LOG_FILE,
-    maxBytes=5 * 1024 * 1024,  # 5MB
-    backupCount=5
-)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(formatter)
-
-# Timed rotating file handler (rotates daily, keeps 7 days of logs)
-timed_file_handler = logging.handlers.TimedRotatingFileHandler(
-    LOG_FILE,
-    when='midnight',
-    interval=1,
-    backupCount=7
-)
-timed_file_handler.setLevel(logging.DEBUG)
-timed_file_handler.setFormatter(formatter)
-
-# Add handlers to the logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
-
-
-def read_dataset(url):
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columns read by DataProcessor.process and ExtractVariables.extract, plus the ones the
+# analysis keeps afterwards. Everything else in the Jiji export is dropped right after cleaning.
+PIPELINE_COLUMNS = [
+    "id", "title", "description", "property_details", "price", "price_view", "price_period",
+    "region_name", "region_parent_name", "listing_by", "time_on_jiji", "seller_or_agent_name",
+    "property_use",
+]
+# Low-cardinality fields, parsed straight into categoricals
+CATEGORICAL_COLUMNS = ["region_name", "region_parent_name", "property_use", "price_period", "listing_by"]
+# Free-text fields, parsed into pyarrow-backed strings when pyarrow is installed
+TEXT_COLUMNS = [
+    "title", "description", "property_details", "short_description", "seller_or_agent_name",
+    "time_on_jiji", "price_view",
+]
+NUMERIC_COLUMNS = {"price": "float64"}
+
+
+def _text_dtype():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return object
+    return "string[pyarrow]"
+
+
+class IngestionSchema:
+    """
+    Column projection and dtypes for reading the listings CSV.
+
+    Args:
+        usecols (list, optional): Columns to parse; columns missing from the file are ignored.
+                All columns are parsed when None.
+        dtypes (dict, optional): Column name to dtype. Entries for columns that are not read are ignored.
+    """
+
+    def __init__(self, usecols=None, dtypes=None):
+        self.usecols = list(usecols) if usecols is not None else None
+        self.dtypes = dict(dtypes or {})
+
+    def read_csv_kwargs(self) -> dict:
+        kwargs = {"dtype": self.dtypes}
+        if self.usecols is not None:
+            wanted = set(self.usecols)
+            kwargs["usecols"] = lambda col: col in wanted
+        return kwargs
+
+
+def pipeline_schema(usecols=PIPELINE_COLUMNS) -> IngestionSchema:
+    """The schema for the cleaning pipeline: pruned columns, categoricals and pyarrow strings."""
+    dtypes = {col: "category" for col in CATEGORICAL_COLUMNS}
+    dtypes.update({col: _text_dtype() for col in TEXT_COLUMNS})
+    dtypes.update(NUMERIC_COLUMNS)
+    return IngestionSchema(usecols, dtypes)
+
+
+def ingestion_stats(df: pd.DataFrame, seconds: float) -> dict:
+    """Parse time and memory figures for a loaded DataFrame."""
+    memory_bytes = int(df.memory_usage(deep=True).sum())
+    return {
+        "rows": len(df),
+        "columns": df.shape[1],
+        "parse_seconds": round(seconds, 4),
+        "memory_bytes": memory_bytes,
+        "bytes_per_row": round(memory_bytes / len(df), 1) if len(df) else 0.0,
+    }
+
+
+def read_dataset(url, chunksize=None, schema=None):
     """
     Reads a dataset from a specified URL into a pandas DataFrame.
 
     Args:
         url (str): The URL or file path to the dataset in CSV format.
+        chunksize (int, optional): Number of rows per chunk. When given, the file is streamed
+                and an iterator of DataFrames is returned instead of a single DataFrame.
+        schema (IngestionSchema, optional): Columns to read and their dtypes, e.g. pipeline_schema().
+                Without one every column is read with inferred dtypes.
 
     Returns:
-        pandas.DataFrame: The loaded dataset as a DataFrame.
+        pandas.DataFrame: The loaded dataset as a DataFrame, or an iterator of DataFrame
+                chunks when chunksize is given.
 
     Raises:
         Exception: Propagates any exception encountered while loading the dataset,
                 with an error logged for debugging.
     """
     try:
-        logger.info("Success! File loaded into a pandas dataframe")
-        return pd.read_csv(url)
+        kwargs = schema.read_csv_kwargs() if schema is not None else {}
+        if chunksize is not None:
+            logger.info("Success! File opened for chunked reading")
+            return pd.read_csv(url, chunksize=chunksize, **kwargs)
+        start = time.perf_counter()
+        df = pd.read_csv(url, **kwargs)
+        stats = ingestion_stats(df, time.perf_counter() - start)
+        logger.info(
+            f"Success! File loaded into a pandas dataframe: {stats['rows']} rows x {stats['columns']} columns "
+            f"in {stats['parse_seconds']}s, {stats['memory_bytes']} bytes ({stats['bytes_per_row']} bytes/row)"
+        )
+        return df
     except Exception as e:
         logger.error("Error while loading your dataset")
         raise e
\ No newline at end of file
@@ -0,0 +1,49 @@
+import pandas as pd
+
+# Separates the fields of a multi-column text key and stands in for missing values
+FIELD_SEPARATOR = "\x1f"
+MISSING = "\x00"
+
+
+def map_unique(series: pd.Series, func) -> pd.Series:
+    """
+    Applies a per-value transform once for every distinct value of a Series.
+
+    The Series is factorized, func runs over the distinct values only and the results are
+    mapped back to the original rows, so repeated strings are parsed a single time.
+
+    Args:
+        series (pd.Series): The column to transform.
+        func (callable): A pure function of one value.
+
+    Returns:
+        pd.Series: The transformed values, aligned with the input index.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    results = pd.Series([func(value) for value in uniques])
+    mapped = results.take(codes)
+    mapped.index = series.index
+    mapped.name = series.name
+    return mapped
+
+
+def apply_values(series: pd.Series, func, unique: bool = True) -> pd.Series:
+    """
+    Applies func to every value of a Series, once per distinct value when unique is True
+    and once per row through Series.apply otherwise.
+    """
+    if unique:
+        return map_unique(series, func)
+    return series.apply(func)
+
+
+
+def source_text(df: pd.DataFrame, columns) -> pd.Series:
+    """
+    Joins the given columns of every row into one key string, keeping missing and empty values apart.
+    """
+    text = None
+    for col in columns:
+        values = df[col].astype(object).where(df[col].notna(), MISSING).astype(str)
+        text = values if text is None else text + FIELD_SEPARATOR + values
+    return text
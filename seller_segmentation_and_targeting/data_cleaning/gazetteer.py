@@ -0,0 +1,84 @@
+from collections import deque
+
+NO_MATCH = float("inf")
+
+
+class CountyGazetteer:
+    """
+    Aho-Corasick automaton over the lowercased location names of a county gazetteer.
+
+    One pass over a text finds every location it contains. Each automaton state keeps the
+    lowest rank (position in the gazetteer dict) of the counties whose locations end there,
+    so the county returned is the first one in dict order with any location in the text.
+    """
+
+    def __init__(self, counties: dict):
+        self.counties = list(counties)
+        self._goto = [{}]
+        self._fail = [0]
+        self._rank = [NO_MATCH]
+        for rank, locations in enumerate(counties.values()):
+            for location in locations:
+                self._insert(location.lower(), rank)
+        self._link()
+
+    def _insert(self, word, rank):
+        state = 0
+        for char in word:
+            child = self._goto[state].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._rank.append(NO_MATCH)
+                self._goto[state][char] = child
+            state = child
+        self._rank[state] = min(self._rank[state], rank)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._rank[child] = min(self._rank[child], self._rank[self._fail[child]])
+                queue.append(child)
+
+    def find(self, text: str):
+        """
+        Finds the county for a lowercased text.
+
+        Args:
+            text (str): Lowercased region name or description.
+
+        Returns:
+            str or None: The first county, in gazetteer order, with a location in the text.
+        """
+        goto, fail, ranks = self._goto, self._fail, self._rank
+        best = ranks[0]
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if ranks[state] < best:
+                best = ranks[state]
+                if best == 0:
+                    break
+        return None if best == NO_MATCH else self.counties[best]
+
+
+_GAZETTEERS = {}
+
+
+def county_gazetteer(counties: dict) -> CountyGazetteer:
+    """Returns the automaton for a county gazetteer, building it once per process."""
+    key = tuple((county, tuple(locations)) for county, locations in counties.items())
+    gazetteer = _GAZETTEERS.get(key)
+    if gazetteer is None:
+        gazetteer = _GAZETTEERS[key] = CountyGazetteer(counties)
+    return gazetteer
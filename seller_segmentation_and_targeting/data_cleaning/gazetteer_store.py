@@ -0,0 +1,106 @@
+import gc
+import json
+import os
+import sys
+from types import MappingProxyType
+from gazetteer import county_gazetteer
+from census import county_dimension
+
+GAZETTEER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gazetteer.json")
+
+
+class GazetteerStore:
+    """
+    Read-only county gazetteer and 2019 census figures, loaded once per process from the
+    packaged gazetteer.json.
+
+    Location lists are stored as tuples of interned strings and the mappings are read-only
+    views, so one copy serves every ExtractVariables instance. The county automaton and the
+    census dimension table are built from it on first use.
+
+    Attributes:
+        version (str): Version of the data file; bump it in gazetteer.json whenever the data changes.
+    """
+
+    def __init__(self, data: dict):
+        self.version = data["version"]
+        self.kenyan_counties = MappingProxyType({
+            sys.intern(county): tuple(sys.intern(location) for location in locations)
+            for county, locations in data["kenyan_counties"].items()
+        })
+        self.population_parameters = MappingProxyType(data["population_parameters"])
+        self.crime_rates = MappingProxyType(data.get("crime_rates", {}))
+        self._automaton = None
+        self._dimension = None
+
+    @property
+    def automaton(self):
+        """The Aho-Corasick automaton over the gazetteer locations."""
+        if self._automaton is None:
+            self._automaton = county_gazetteer(self.kenyan_counties)
+        return self._automaton
+
+    @property
+    def dimension(self):
+        """The census figures as a CountyDimension, with every gazetteer county resolved."""
+        if self._dimension is None:
+            self._dimension = county_dimension(self.population_parameters)
+            self._dimension.add_aliases(self.kenyan_counties)
+        return self._dimension
+
+    def find_county(self, text: str):
+        """Returns the first county, in gazetteer order, with a location in the lowercased text, or None."""
+        return self.automaton.find(text)
+
+    def census_county(self, county):
+        """Returns the census county name for a gazetteer county value, or None."""
+        return self.dimension.match(county)
+
+    def density(self, census_county):
+        """Population density (persons per sq. km) of a census county."""
+        return self.dimension.table.at[census_county, "density"]
+
+
+_STORES = {}
+
+
+def gazetteer_store(path=GAZETTEER_FILE, version=None) -> GazetteerStore:
+    """
+    Returns the gazetteer store for a data file, loading it once per process.
+
+    Args:
+        path (str): The gazetteer JSON file; defaults to the packaged one.
+        version (str, optional): The data version the caller was written against.
+
+    Raises:
+        ValueError: If version is given and the file holds a different version.
+    """
+    store = _STORES.get(path)
+    if store is None:
+        with open(path, encoding="utf-8") as f:
+            store = _STORES[path] = GazetteerStore(json.load(f))
+    if version is not None and store.version != version:
+        raise ValueError(f"Gazetteer data at {path} is version {store.version}, expected {version}")
+    return store
+
+
+_freeze_at_fork = False
+
+
+def share_with_workers(path=GAZETTEER_FILE) -> GazetteerStore:
+    """
+    Builds the store, automaton and census table in the parent before a process pool forks.
+
+    From the first call on, every fork moves the objects alive into the garbage collector's
+    permanent generation just before forking, so collections in the child never write to those
+    pages and they stay shared with the parent. The parent unfreezes right after the fork, so
+    its own garbage is still collected.
+    """
+    global _freeze_at_fork
+    store = gazetteer_store(path)
+    store.automaton
+    store.dimension
+    if not _freeze_at_fork and hasattr(os, "register_at_fork"):
+        os.register_at_fork(before=gc.freeze, after_in_parent=gc.unfreeze)
+        _freeze_at_fork = True
+    return store
@@ -0,0 +1,123 @@
+import time
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+import size_grammar
+from size_grammar import SIZE_BRANCHES, acreage_converter
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Hectare units of the numeric and hyphenated branches
+HECTARE_UNITS = ("ha", "hectare", "hectares")
+
+
+class BranchProfiler:
+    """
+    Counts and times, per branch, the size searches of extract_and_fill_size and the acreage
+    conversions of convert_to_acreage while installed by profile_branches.
+
+    Extraction time is charged to the grammar branch that matched, or to 'rejected' when the
+    anchor scan ruled the text out and 'no_match' when the grammar found nothing. Conversion
+    time is charged to the branch the converter took, with numeric and hyphenated sizes split
+    by acre or hectare unit and dimensions by whether the fraction table answered. With
+    evaluate_unique, conversions are counted once per distinct size.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.seconds = {}
+
+    def _add(self, stage, branch, seconds):
+        key = (stage, branch)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.seconds[key] = self.seconds.get(key, 0.0) + seconds
+
+    def record_extraction(self, anchor, match, seconds):
+        """Charges one row of size_grammar.extract_sizes to its branch."""
+        if anchor is None:
+            branch = "rejected"
+        else:
+            branch = match.lastgroup if match else "no_match"
+        self._add("extract", branch, seconds)
+
+    def size_to_acres(self, size):
+        """size_grammar.size_to_acres, timing every value."""
+        converter = acreage_converter()
+        start = time.perf_counter()
+        match = None
+        if pd.isna(size):
+            value = np.nan
+        else:
+            match = size_grammar.size_grammar().search(str(size).lower().strip())
+            value = converter.from_match(match) if match else np.nan
+        seconds = time.perf_counter() - start
+        self._add("convert", self.conversion_branch(size, match), seconds)
+        return value
+
+    @staticmethod
+    def conversion_branch(size, match) -> str:
+        if match is None:
+            return "missing" if pd.isna(size) else "no_match"
+        branch = match.lastgroup
+        if branch in ("numeric", "hyphenated") and match[f"{branch}_unit"].lower() in HECTARE_UNITS:
+            return f"{branch}_hectare"
+        if branch in ("dimensions", "ft_dimensions") and acreage_converter().fraction_acres(match[0]) is not None:
+            return f"{branch}_fraction_table"
+        return branch
+
+    def report(self) -> pd.DataFrame:
+        """
+        Branches ranked by total time, with grammar branches that never matched listed last.
+
+        Returns:
+            pd.DataFrame: stage, branch, matches, seconds, share of the stage's time and mean
+                microseconds per match.
+        """
+        keys = set(self.counts) | {("extract", name) for name, _ in SIZE_BRANCHES}
+        report = pd.DataFrame(
+            [(stage, branch, self.counts.get((stage, branch), 0), self.seconds.get((stage, branch), 0.0))
+             for stage, branch in keys],
+            columns=["stage", "branch", "matches", "seconds"],
+        )
+        stage_seconds = report.groupby("stage")["seconds"].transform("sum")
+        report["share"] = (report["seconds"] / stage_seconds).fillna(0.0)
+        report["mean_us"] = (report["seconds"] / report["matches"] * 1e6).where(report["matches"] > 0)
+        return report.sort_values(["seconds", "matches", "stage", "branch"], ascending=[False, False, True, True],
+                                  ignore_index=True)
+
+    def format_report(self) -> str:
+        report = self.report()
+        lines = [f"{'stage':<9}{'branch':<28}{'matches':>10}{'seconds':>10}{'share':>8}{'mean us':>10}"]
+        for row in report.itertuples(index=False):
+            mean = "-" if pd.isna(row.mean_us) else f"{row.mean_us:.1f}"
+            lines.append(
+                f"{row.stage:<9}{row.branch:<28}{row.matches:>10,}{row.seconds:>10.3f}{row.share:>8.1%}{mean:>10}"
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_branches(profiler=None):
+    """
+    Profiles the size grammar and acreage conversion branches for the duration of the block and
+    logs the ranked report on exit. Outside the block the pipeline runs its unprofiled code.
+
+    Only the pandas stages report to the profiler: with a memo store, sizes found in the memo
+    are not searched again, and backend="polars" runs the grammar in Polars, so neither is
+    counted. A warning is logged when the block profiled nothing.
+
+    Example:
+        with profile_branches() as profiler:
+            DataProcessor().process(df)
+        profiler.report()
+    """
+    profiler = profiler or BranchProfiler()
+    previous, size_grammar._profiler = size_grammar._profiler, profiler
+    try:
+        yield profiler
+    finally:
+        size_grammar._profiler = previous
+        if not profiler.counts:
+            logger.warning("No size branches were profiled; memoized sizes and the polars backend bypass the profiler")
+        logger.info(f"Size branch profile:\n{profiler.format_report()}")
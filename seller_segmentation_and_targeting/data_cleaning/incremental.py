@@ -0,0 +1,174 @@
+import os
+import time
+from datetime import date
+import numpy as np
+import pandas as pd
+from data_cleaner_and_processor import ExtractVariables
+from pipeline import clean_dataset
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+ID_COL = "id"
+INDEX_FILE = "index.parquet"
+# Scrape fields that change without the listing changing, left out of the row hash, each with
+# the cleaned column derived from it and the function deriving it from the raw column
+VOLATILE_COLUMNS = {"time_on_jiji": ("years_on_jiji", ExtractVariables.parse_time_on_jiji)}
+
+
+def _normalized(column: pd.Series) -> pd.Series:
+    # Numbers hash as floats, so a column read as int64 one day and float64 the next (when a
+    # value is missing) hashes the same; everything else hashes as its string form
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        return column.astype("float64")
+    return column.astype(object).map(lambda value: None if pd.isna(value) else str(value))
+
+
+def row_hashes(df: pd.DataFrame, exclude=VOLATILE_COLUMNS) -> np.ndarray:
+    """
+    64-bit hash of every raw row, over the columns in name order so column order does not
+    matter, and over normalized values so it does not depend on the dtypes read_csv inferred.
+    """
+    columns = sorted(col for col in df.columns if col not in exclude)
+    normalized = pd.DataFrame({col: _normalized(df[col]) for col in columns}, index=df.index)
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+class ListingStore:
+    """
+    Date-partitioned store of cleaned listings, updated incrementally from daily scrapes.
+
+    Each upsert cleans only the rows whose id is new or whose raw content changed, and writes
+    them as one Parquet part under scrape_date=YYYY-MM-DD/. A small index maps every id to the
+    hash of its latest raw row and the part holding its latest cleaned version, so a daily run
+    reads the index and the new scrape but never the history, and older parts are left untouched.
+
+    Volatile columns are left out of the hash, so a listing whose only change is, say, its time
+    on Jiji is not cleaned again. The index keeps the latest scrape's raw value of each volatile
+    column instead, and load derives the cleaned column from it, so years_on_jiji is that of the
+    latest scrape for every listing rather than that of the scrape its part was cleaned from.
+
+    Args:
+        root (str): Directory of the store; created if missing.
+        id_col (str): Column identifying a listing across scrapes.
+        volatile_columns (dict): Columns whose changes alone do not make a listing changed, each
+            mapped to the cleaned column derived from it and the function deriving it.
+    """
+
+    def __init__(self, root, id_col=ID_COL, volatile_columns=VOLATILE_COLUMNS):
+        self.root = root
+        self.id_col = id_col
+        self.volatile_columns = dict(volatile_columns)
+        os.makedirs(root, exist_ok=True)
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, INDEX_FILE)
+
+    def read_index(self) -> pd.DataFrame:
+        """
+        The id index: row_hash, part (None when cleaning dropped the row) and the latest raw value
+        of each volatile column, indexed by id.
+        """
+        if not os.path.exists(self.index_path):
+            return pd.DataFrame({"row_hash": pd.Series(dtype="uint64"), "part": pd.Series(dtype=object)},
+                                index=pd.Index([], name=self.id_col))
+        return pd.read_parquet(self.index_path)
+
+    def _write_index(self, index: pd.DataFrame):
+        tmp_path = self.index_path + ".tmp"
+        index.to_parquet(tmp_path)
+        os.replace(tmp_path, self.index_path)
+
+    def _new_part(self, scrape_date):
+        directory = os.path.join(self.root, f"scrape_date={scrape_date}")
+        os.makedirs(directory, exist_ok=True)
+        number = len([name for name in os.listdir(directory) if name.endswith(".parquet")])
+        return os.path.join(f"scrape_date={scrape_date}", f"part-{number:04d}.parquet")
+
+    def upsert(self, raw: pd.DataFrame, scrape_date=None, processor=None, extractor=None) -> dict:
+        """
+        Cleans the new and changed rows of a scrape and records them in the store.
+
+        Args:
+            raw (pd.DataFrame): The scrape as read by read_dataset.
+            scrape_date (str, optional): Partition date, YYYY-MM-DD; defaults to today.
+            processor (DataProcessor, optional): Passed to clean_dataset.
+            extractor (ExtractVariables, optional): Passed to clean_dataset.
+
+        Returns:
+            dict: Counts of incoming, new, changed, unchanged and written rows, and the seconds taken.
+        """
+        start = time.perf_counter()
+        scrape_date = scrape_date or date.today().isoformat()
+        # A listing scraped twice in one batch keeps its last row
+        raw = raw.drop_duplicates(subset=self.id_col, keep="last")
+        hashes = row_hashes(raw, self.volatile_columns)
+        index = self.read_index()
+
+        ids = raw[self.id_col].to_numpy()
+        positions = index.index.get_indexer(ids)
+        is_new = positions < 0
+        is_changed = np.zeros(len(raw), dtype=bool)
+        known = ~is_new
+        is_changed[known] = index["row_hash"].to_numpy()[positions[known]] != hashes[known]
+        delta = is_new | is_changed
+
+        written = 0
+        part = None
+        if delta.any():
+            cleaned = clean_dataset(raw[delta], processor, extractor)
+            if len(cleaned):
+                part = self._new_part(scrape_date)
+                cleaned.to_parquet(os.path.join(self.root, part), index=False)
+                written = len(cleaned)
+            kept = set(cleaned[self.id_col]) if len(cleaned) else set()
+            delta_ids = ids[delta]
+            updates = pd.DataFrame({
+                "row_hash": hashes[delta],
+                "part": [part if listing_id in kept else None for listing_id in delta_ids],
+            }, index=pd.Index(delta_ids, name=self.id_col))
+            index = pd.concat([index.drop(index.index.intersection(updates.index)), updates])
+        # Unchanged rows keep their cleaned part but take this scrape's volatile values
+        volatile = [col for col in self.volatile_columns if col in raw.columns]
+        for col in volatile:
+            if col not in index.columns:
+                index[col] = pd.Series(pd.NA, index=index.index, dtype="string")
+            index.loc[ids, col] = raw[col].astype("string").to_numpy()
+            index[col] = index[col].astype("string")
+        if delta.any() or volatile:
+            self._write_index(index)
+
+        stats = {
+            "incoming": len(raw),
+            "new": int(is_new.sum()),
+            "changed": int(is_changed.sum()),
+            "unchanged": int((~delta).sum()),
+            "written": written,
+            "seconds": time.perf_counter() - start,
+        }
+        logger.info(
+            f"Upserted scrape {scrape_date}: {stats['incoming']} rows, {stats['new']} new, {stats['changed']} changed, "
+            f"{stats['unchanged']} unchanged, {stats['written']} cleaned rows written in {stats['seconds']:.2f}s"
+        )
+        return stats
+
+    def load(self) -> pd.DataFrame:
+        """
+        Reads the latest cleaned version of every listing in the store, with the columns derived
+        from volatile columns recomputed from their latest raw values.
+        """
+        index = self.read_index()
+        parts = index["part"].dropna()
+        frames = []
+        for part, ids in parts.groupby(parts, sort=True):
+            df = pd.read_parquet(os.path.join(self.root, part))
+            frames.append(df[df[self.id_col].isin(ids.index)])
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        for col, (derived, derive) in self.volatile_columns.items():
+            if col in index.columns and derived in df.columns:
+                latest = index[col].reindex(df[self.id_col].to_numpy())
+                df[derived] = derive(pd.Series(latest.to_numpy(), index=df.index, name=col)).to_numpy()
+        return df
@@ -0,0 +1,162 @@
+import json
+import os
+import time
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+METRIC_PREFIX = "land_pipeline_stage"
+
+# Statistics reported by the stage Instrumentation.run is currently running, None outside a run
+_stage_stats = None
+
+
+def _rss_bytes():
+    """Current resident set size of this process, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time, rows in and out and the change in resident memory for every
+    pipeline stage, and passes each record to the registered hooks.
+
+    A hook is any callable taking one record dict with the keys pipeline, stage, started_at,
+    wall_seconds, cpu_seconds, rows_in, rows_out, rows_dropped, memory_delta_bytes (None
+    where resident memory cannot be read) and stats, the statistics the stage reported
+    through record_stage_stats.
+    """
+
+    def __init__(self, hooks=None):
+        self.hooks = list(hooks or [])
+        self.records = []
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        return hook
+
+    def run(self, pipeline, stage, func, df):
+        """Runs func(df) as one stage, records it and returns func's result."""
+        global _stage_stats
+        rows_in = len(df)
+        memory_before = _rss_bytes()
+        started_at = time.time()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        outer_stats, _stage_stats = _stage_stats, {}
+        try:
+            out = func(df)
+        finally:
+            stats, _stage_stats = _stage_stats, outer_stats
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        memory_after = _rss_bytes()
+        rows_out = len(out)
+        record = {
+            "pipeline": pipeline,
+            "stage": stage,
+            "started_at": started_at,
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": cpu_seconds,
+            "rows_in": rows_in,
+            "rows_out": rows_out,
+            "rows_dropped": rows_in - rows_out,
+            "memory_delta_bytes": None if memory_before is None or memory_after is None else memory_after - memory_before,
+            "stats": stats,
+        }
+        self.records.append(record)
+        for hook in self.hooks:
+            try:
+                hook(record)
+            except Exception as e:
+                # A failing exporter must not fail the pipeline
+                logger.error(f"Instrumentation hook {hook!r} failed on stage {stage}: {e}")
+        return out
+
+
+def record_stage_stats(**stats):
+    """
+    Adds named statistics, such as a filter's reject rate, to the record of the stage being run.
+    Does nothing when the stage is not running under Instrumentation.run.
+    """
+    if _stage_stats is not None:
+        _stage_stats.update(stats)
+
+
+def run_stage(instrumentation, pipeline, stage, func, df):
+    """Calls func(df), through instrumentation.run when instrumentation is enabled."""
+    if instrumentation is None:
+        return func(df)
+    return instrumentation.run(pipeline, stage, func, df)
+
+
+class JsonLinesExporter:
+    """Appends each stage record as one JSON line to a file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, record):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+class PrometheusExporter:
+    """
+    Keeps running totals per pipeline stage and rewrites a Prometheus text-format file after
+    every record, for collection by the node exporter's textfile collector.
+    """
+
+    COUNTERS = {
+        "runs_total": ("Stage executions", None),
+        "wall_seconds_total": ("Wall-clock seconds spent in the stage", "wall_seconds"),
+        "cpu_seconds_total": ("Process CPU seconds spent in the stage", "cpu_seconds"),
+        "rows_in_total": ("Rows entering the stage", "rows_in"),
+        "rows_out_total": ("Rows leaving the stage", "rows_out"),
+        "rows_dropped_total": ("Rows removed by the stage", "rows_dropped"),
+    }
+
+    def __init__(self, path):
+        self.path = path
+        self.totals = {}
+        self.memory_delta = {}
+        self.stats = {}
+
+    def __call__(self, record):
+        labels = (record["pipeline"], record["stage"])
+        totals = self.totals.setdefault(labels, dict.fromkeys(self.COUNTERS, 0))
+        for name, (_, field) in self.COUNTERS.items():
+            totals[name] += 1 if field is None else record[field]
+        if record["memory_delta_bytes"] is not None:
+            self.memory_delta[labels] = record["memory_delta_bytes"]
+        for name, value in record.get("stats", {}).items():
+            self.stats[(*labels, name)] = value
+        self.write()
+
+    def render(self) -> str:
+        lines = []
+        for name, (help_text, _) in self.COUNTERS.items():
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            for (pipeline, stage), totals in self.totals.items():
+                lines.append(f'{METRIC_PREFIX}_{name}{{pipeline="{pipeline}",stage="{stage}"}} {totals[name]}')
+        lines.append(f"# HELP {METRIC_PREFIX}_memory_delta_bytes Resident memory change over the last run of the stage")
+        lines.append(f"# TYPE {METRIC_PREFIX}_memory_delta_bytes gauge")
+        for (pipeline, stage), delta in self.memory_delta.items():
+            lines.append(f'{METRIC_PREFIX}_memory_delta_bytes{{pipeline="{pipeline}",stage="{stage}"}} {delta}')
+        lines.append(f"# HELP {METRIC_PREFIX}_stat Last value of a statistic reported by the stage")
+        lines.append(f"# TYPE {METRIC_PREFIX}_stat gauge")
+        for (pipeline, stage, name), value in self.stats.items():
+            lines.append(f'{METRIC_PREFIX}_stat{{pipeline="{pipeline}",stage="{stage}",stat="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        # Write then rename so a scraper never reads a half-written file
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+from result_cache import code_fingerprint
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MEMO_PATH = os.path.join(os.path.expanduser("~"), ".cache", "seller_segmentation", "memo.sqlite")
+DEFAULT_MAX_ENTRIES = 2_000_000
+# Values stored per entry; SQLite keeps each one as a native string, float or NULL
+MAX_VALUES = 4
+# An entry found again is marked as used at most once per interval, so hits rarely write
+REFRESH_SECONDS = 86_400
+# Entries allowed over max_entries, as a fraction of it, before an insert evicts
+EVICTION_SLACK = 0.1
+
+
+class MemoStore:
+    """
+    Persistent memo of values extracted from listing text, shared across runs and datasets.
+
+    Entries are keyed by a 64-bit hash of the normalized source text, under a namespace per
+    extraction (e.g. 'size', 'county') and a version that defaults to the processing code
+    fingerprint, so changing the size grammar or the gazetteer stops old entries from matching.
+    Lookups and inserts are done in bulk over the distinct texts of a column. Entries record the
+    day they were last used, and the least recently used ones are evicted once the store holds
+    more than max_entries: last_used is kept in seconds, refreshed at most daily on hits, and ties
+    go to the entry inserted last. Inserts keep a running count and only evict once the store is
+    EVICTION_SLACK past max_entries, so the table is not counted on every batch.
+
+    Args:
+        path (str): SQLite database file; its directory is created if missing.
+        max_entries (int): Entries kept after each insert, across all namespaces and versions.
+        version (str, optional): Key version; defaults to code_fingerprint().
+    """
+
+    def __init__(self, path=DEFAULT_MEMO_PATH, max_entries=DEFAULT_MAX_ENTRIES, version=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version or code_fingerprint()[:16]
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._count = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The database connection, opened on first use so the store can be handed to workers unopened."""
+        if self._connection is None:
+            value_columns = ", ".join(f"v{i}" for i in range(MAX_VALUES))
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.executescript(f"""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS memo (
+                    version TEXT NOT NULL,
+                    namespace TEXT NOT NULL,
+                    key INTEGER NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    {value_columns},
+                    PRIMARY KEY (version, namespace, key)
+                );
+                CREATE INDEX IF NOT EXISTS memo_last_used ON memo (last_used);
+                CREATE TEMP TABLE IF NOT EXISTS lookup_keys (key INTEGER PRIMARY KEY);
+            """)
+        return self._connection
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_count"] = None
+        return state
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def hash_keys(texts) -> np.ndarray:
+        """64-bit keys for an array of strings, as signed integers for SQLite."""
+        return pd.util.hash_array(np.asarray(texts, dtype=object)).view(np.int64)
+
+    @staticmethod
+    def now() -> int:
+        return int(time.time())
+
+    @property
+    def high_water(self) -> int:
+        """Entry count past which an insert evicts down to max_entries."""
+        return self.max_entries + max(1, int(self.max_entries * EVICTION_SLACK))
+
+    def entry_count(self) -> int:
+        """Entries in the store, counted once and then kept up to date by insert and evict."""
+        if self._count is None:
+            (self._count,) = self.connection.execute("SELECT COUNT(*) FROM memo").fetchone()
+        return self._count
+
+    def lookup(self, namespace: str, keys, width: int) -> list:
+        """
+        Returns (key, value, ...) tuples with the first width values of the keys found, and marks
+        them as used now. Entries already marked within REFRESH_SECONDS are not rewritten.
+        """
+        value_columns = ", ".join(f"memo.v{i}" for i in range(width))
+        connection = self.connection
+        now = self.now()
+        with connection:
+            connection.execute("DELETE FROM lookup_keys")
+            connection.executemany("INSERT OR IGNORE INTO lookup_keys VALUES (?)", ((int(key),) for key in keys))
+            # CROSS JOIN keeps lookup_keys as the outer loop, so the cost follows the keys looked up
+            rows = connection.execute(
+                f"SELECT memo.key, {value_columns} FROM lookup_keys CROSS JOIN memo"
+                " ON memo.version = ? AND memo.namespace = ? AND memo.key = lookup_keys.key",
+                (self.version, namespace),
+            ).fetchall()
+            connection.execute(
+                "UPDATE memo SET last_used = ? WHERE version = ? AND namespace = ? AND last_used < ?"
+                " AND key IN (SELECT key FROM lookup_keys)",
+                (now, self.version, namespace, now - REFRESH_SECONDS),
+            )
+        return rows
+
+    def insert(self, namespace: str, keys, rows):
+        """
+        Stores the values of each key, with None for missing values, then evicts the least
+        recently used entries once the store has grown past high_water.
+        """
+        now = self.now()
+        padding = (None,) * MAX_VALUES
+        records = [
+            (self.version, namespace, int(key), now, *row, *padding[len(row):])
+            for key, row in zip(keys, rows)
+        ]
+        placeholders = ", ".join("?" * (4 + MAX_VALUES))
+        count = self.entry_count()
+        with self.connection:
+            self.connection.executemany(f"INSERT OR REPLACE INTO memo VALUES ({placeholders})", records)
+        # Replaced entries and other writers make this an overestimate, which evict corrects
+        self._count = count + len(records)
+        if self._count > self.high_water:
+            self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the store holds at most max_entries."""
+        with self.connection:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM memo").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                # INSERT OR REPLACE gives every written row a new, higher rowid
+                self.connection.execute(
+                    "DELETE FROM memo WHERE rowid IN (SELECT rowid FROM memo ORDER BY last_used, rowid LIMIT ?)",
+                    (excess,),
+                )
+                logger.info(f"Evicted {excess} memo entries")
+        self._count = min(count, self.max_entries)
+
+    def clear(self, namespace=None):
+        """Drops every entry, or those of one namespace, across all versions."""
+        with self.connection:
+            if namespace is None:
+                self.connection.execute("DELETE FROM memo")
+            else:
+                self.connection.execute("DELETE FROM memo WHERE namespace = ?", (namespace,))
+        self._count = None
+
+    def memoize(self, namespace: str, text: pd.Series, columns, compute) -> pd.DataFrame:
+        """
+        Looks up every distinct text of a column and computes only the ones not stored yet.
+
+        Args:
+            namespace (str): The extraction the values belong to.
+            text (pd.Series): The normalized source text of each row, e.g. from evaluation.source_text.
+            columns (list): Names of the values stored per text.
+            compute (callable): Takes the row positions of one representative row per missing
+                text and returns a DataFrame of the columns indexed by those positions; rows it
+                leaves out are stored as missing values.
+
+        Returns:
+            pd.DataFrame: The columns for every row, aligned with text.
+        """
+        columns = list(columns)
+        if len(columns) > MAX_VALUES:
+            raise ValueError(f"A memo entry holds at most {MAX_VALUES} values, got {len(columns)}")
+        codes, uniques = pd.factorize(text)
+        keys = self.hash_keys(uniques)
+        found = pd.DataFrame.from_records(
+            self.lookup(namespace, keys, len(columns)), columns=["key", *columns], coerce_float=True
+        )
+        table = found.set_index("key").reindex(keys)
+        missing = np.flatnonzero(~np.isin(keys, found["key"].to_numpy()))
+        if len(missing):
+            first_positions = np.unique(codes, return_index=True)[1]
+            positions = first_positions[missing]
+            computed = compute(positions).reindex(positions)[columns].astype(object)
+            computed = computed.where(computed.notna(), None)
+            self.insert(namespace, keys[missing], computed.to_numpy().tolist())
+            table = table.astype(object)
+            table.iloc[missing] = computed.to_numpy()
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        logger.info(f"Memo '{namespace}': {len(keys) - len(missing)} of {len(keys)} distinct texts found")
+        result = table.infer_objects().take(codes)
+        result.index = text.index
+        return result
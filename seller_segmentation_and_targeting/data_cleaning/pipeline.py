@@ -0,0 +1,277 @@
+import os
+import numpy as np
+import pandas as pd
+from data_ingestion import CATEGORICAL_COLUMNS, TEXT_COLUMNS, read_dataset
+from census import CENSUS_COLUMNS
+from data_cleaner_and_processor import DataProcessor, ExtractVariables
+from pipeline_logging import get_logger, init_worker_logging, worker_log_queue
+from gazetteer_store import share_with_workers
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNKSIZE = 50_000
+# Rows sampled from the head of a CSV to estimate its in-memory size
+SAMPLE_ROWS = 1_000
+# Full-frame copies alive at once while process() and extract() run
+PIPELINE_COPIES = 3
+# Output types of the columns the pipeline reads or derives, fixed so every chunk of a streamed
+# file fits one Parquet schema whatever read_csv inferred for the chunk
+TEXT_OUTPUT_COLUMNS = [*TEXT_COLUMNS, *CATEGORICAL_COLUMNS, "size", "county"]
+FLOAT_OUTPUT_COLUMNS = ["price_in_KES", "acreage", "price_per_acre(KES)", "years_on_jiji", *CENSUS_COLUMNS.values()]
+
+
+class CsvSink:
+    """Writes cleaned chunks to one CSV file, emitting the header with the first chunk."""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows_written = 0
+
+    def write(self, df: pd.DataFrame):
+        df.to_csv(self.path, mode="a" if self.rows_written else "w", header=not self.rows_written, index=False)
+        self.rows_written += len(df)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def output_schema(df: pd.DataFrame):
+    """
+    The Parquet schema of a cleaned file: the pinned types of TEXT_OUTPUT_COLUMNS and
+    FLOAT_OUTPUT_COLUMNS, and for any other column the type of the first chunk, or text when
+    the first chunk has no values for it.
+    """
+    import pyarrow as pa
+
+    pinned = {col: pa.large_string() for col in TEXT_OUTPUT_COLUMNS}
+    pinned.update({col: pa.large_string() for col in df.columns if col not in pinned and df[col].isna().all()})
+    pinned.update({col: pa.float64() for col in FLOAT_OUTPUT_COLUMNS})
+    inferred = pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema(
+        [field.with_type(pinned.get(field.name, field.type)) for field in inferred], metadata=inferred.metadata
+    )
+
+
+class ParquetSink:
+    """
+    Writes cleaned chunks as row groups of one Parquet file. Requires pyarrow.
+
+    Every chunk is cast to output_schema of the first. Text columns take any chunk's values as
+    strings, while other casts that would lose values, e.g. 1.5 into an integer column, raise.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.rows_written = 0
+        self._writer = None
+
+    def write(self, df: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, output_schema(df))
+        # A text column arrives as categoricals, or as float NaNs in a chunk where it is empty
+        text = [field.name for field in self._writer.schema if pa.types.is_large_string(field.type)]
+        df = df.astype({col: "string" for col in text if col in df.columns})
+        table = pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+        self.rows_written += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_sink(path):
+    """Returns a Parquet sink for .parquet paths and a CSV sink otherwise."""
+    if str(path).endswith(".parquet"):
+        return ParquetSink(path)
+    return CsvSink(path)
+
+
+def clean_dataset(df: pd.DataFrame, processor=None, extractor=None) -> pd.DataFrame:
+    """Runs DataProcessor.process and ExtractVariables.extract over a DataFrame."""
+    processor = processor or DataProcessor()
+    extractor = extractor or ExtractVariables()
+    return extractor.extract(processor.process(df))
+
+
+# Per-worker pipeline objects, created once by _init_worker when a worker process starts
+_worker_processor = None
+_worker_extractor = None
+
+
+def _init_worker(evaluate_unique, log_queue):
+    global _worker_processor, _worker_extractor
+    init_worker_logging(log_queue)
+    # Forked workers inherit the parent's gazetteer store; spawned ones load it here, once for
+    # the life of the worker.
+    _worker_processor = DataProcessor(evaluate_unique)
+    _worker_extractor = ExtractVariables(evaluate_unique)
+
+
+def _clean_partition(partition: pd.DataFrame) -> pd.DataFrame:
+    return clean_dataset(partition, _worker_processor, _worker_extractor)
+
+
+def worker_pool(workers=None, evaluate_unique=True):
+    """Starts a process pool whose workers each hold their own DataProcessor and ExtractVariables."""
+    # Imported here so short-lived callers that never start a pool do not pay for it
+    from concurrent.futures import ProcessPoolExecutor
+
+    share_with_workers()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(evaluate_unique, worker_log_queue()))
+
+
+def clean_partitioned(df: pd.DataFrame, pool, partitions: int) -> pd.DataFrame:
+    """
+    Splits a DataFrame into contiguous row partitions, cleans them on the pool and
+    concatenates the results in the original row order.
+    """
+    bounds = np.linspace(0, len(df), max(partitions, 1) + 1, dtype=int)
+    parts = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    if not parts:
+        return clean_dataset(df)
+    return pd.concat(pool.map(_clean_partition, parts))
+
+
+def clean_dataset_parallel(df: pd.DataFrame, workers=None, evaluate_unique=True) -> pd.DataFrame:
+    """
+    Runs the full clean-and-extract chain over row partitions in a process pool.
+
+    Args:
+        df (pd.DataFrame): Raw listings.
+        workers (int, optional): Worker processes; defaults to the number of CPUs.
+        evaluate_unique (bool): Passed to DataProcessor and ExtractVariables in each worker.
+
+    Returns:
+        pd.DataFrame: The cleaned listings, in the same order as a single-process run.
+    """
+    workers = workers or os.cpu_count() or 1
+    with worker_pool(workers, evaluate_unique) as pool:
+        return clean_partitioned(df, pool, workers)
+
+
+def estimate_memory(url, sample_rows=SAMPLE_ROWS, schema=None):
+    """
+    Estimates the peak memory, in bytes, of cleaning a CSV file in one piece.
+
+    The head of the file is parsed, with the schema the file will be read with, to measure how
+    much larger rows are in memory than on disk, and the ratio is scaled to the file size and
+    the copies the pipeline keeps alive.
+
+    Returns:
+        int or None: The estimate, or None if the source is not a local file.
+    """
+    if not os.path.isfile(url):
+        return None
+    sample = pd.read_csv(url, nrows=sample_rows)
+    if sample.empty:
+        return 0
+    sample_disk_bytes = len(sample.to_csv(index=False).encode("utf-8"))
+    if schema is not None:
+        sample = pd.read_csv(url, nrows=sample_rows, **schema.read_csv_kwargs())
+    sample_memory_bytes = sample.memory_usage(deep=True).sum()
+    return int(os.path.getsize(url) * sample_memory_bytes / sample_disk_bytes * PIPELINE_COPIES)
+
+
+def stream_dataset(url, sink, chunksize=DEFAULT_CHUNKSIZE, processor=None, extractor=None, workers=1, schema=None):
+    """
+    Cleans a CSV chunk by chunk, writing each cleaned chunk to the sink as soon as it is ready,
+    so only one chunk is held in memory at a time.
+
+    Args:
+        url (str): Path or URL of the listings CSV.
+        sink (CsvSink or ParquetSink): Where cleaned chunks are written.
+        chunksize (int): Rows read per chunk.
+        workers (int): With more than one worker, each chunk is split across a process pool.
+        schema (IngestionSchema, optional): Passed to read_dataset, e.g. pipeline_schema().
+
+    Returns:
+        int: The number of cleaned rows written.
+    """
+    processor = processor or DataProcessor()
+    extractor = extractor or ExtractVariables()
+    pool = worker_pool(workers, processor.evaluate_unique) if workers > 1 else None
+    rows = 0
+    try:
+        for chunk in read_dataset(url, chunksize=chunksize, schema=schema):
+            if pool is None:
+                cleaned = clean_dataset(chunk, processor, extractor)
+            else:
+                cleaned = clean_partitioned(chunk, pool, workers)
+            sink.write(cleaned)
+            rows += len(cleaned)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    logger.info(f"Streamed {rows} cleaned rows from {url} in chunks of {chunksize}")
+    return rows
+
+
+def run_pipeline(url, sink, memory_budget=None, chunksize=DEFAULT_CHUNKSIZE, processor=None, extractor=None, workers=1,
+                 schema=None):
+    """
+    Cleans a listings CSV into a sink, streaming it in chunks when it would not fit in memory.
+
+    Args:
+        url (str): Path or URL of the listings CSV.
+        sink (CsvSink or ParquetSink): Where the cleaned rows are written.
+        memory_budget (int, optional): Bytes the pipeline may use. When the estimated in-memory
+                size exceeds it, the file is streamed in chunks; without a budget it is loaded whole.
+        chunksize (int): Rows per chunk in streaming mode.
+        workers (int): Worker processes; with more than one, rows are cleaned in parallel partitions.
+        schema (IngestionSchema, optional): Passed to read_dataset, e.g. pipeline_schema(); every
+                column is read with inferred dtypes without one.
+
+    Returns:
+        int: The number of cleaned rows written.
+    """
+    estimate = estimate_memory(url, schema=schema) if memory_budget is not None else None
+    if estimate is not None and estimate > memory_budget:
+        logger.info(f"Estimated {estimate} bytes exceeds the {memory_budget} byte budget, streaming {url}")
+        return stream_dataset(url, sink, chunksize, processor, extractor, workers, schema)
+    if workers > 1:
+        evaluate_unique = processor.evaluate_unique if processor else True
+        cleaned = clean_dataset_parallel(read_dataset(url, schema=schema), workers, evaluate_unique)
+    else:
+        cleaned = clean_dataset(read_dataset(url, schema=schema), processor, extractor)
+    sink.write(cleaned)
+    return len(cleaned)
+
+
+def clean_file(url, output_path, memory_budget=None, chunksize=DEFAULT_CHUNKSIZE, schema=None):
+    """
+    Cleans one listings CSV into output_path (Parquet or CSV by extension), reading it with
+    schema when given. In a worker_pool worker the worker's DataProcessor and ExtractVariables
+    are reused. The output is written under a temporary name and renamed at the end, so a
+    failed file leaves nothing behind.
+
+    Returns:
+        int: The number of cleaned rows written.
+    """
+    root, extension = os.path.splitext(str(output_path))
+    tmp_path = f"{root}.tmp{extension}"
+    try:
+        with open_sink(tmp_path) as sink:
+            rows = run_pipeline(url, sink, memory_budget, chunksize, _worker_processor, _worker_extractor, schema=schema)
+        os.replace(tmp_path, output_path)
+        return rows
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
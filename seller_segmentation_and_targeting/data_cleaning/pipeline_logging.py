@@ -0,0 +1,158 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+LOG_LEVEL = "DEBUG"
+LOG_FILE = "data_cleaning.log"
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_lock = threading.Lock()
+_state = {
+    "pid": None,            # process that owns the listener
+    "queue": None,          # where the shared handler puts records
+    "handlers": [],         # console and file handlers, driven by the listener threads
+    "listeners": [],
+    "worker_queue": None,   # multiprocessing queue that pool workers log to
+}
+
+
+def _build_handlers(log_file, level):
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    console_handler = logging.StreamHandler()
+    # Rotating file handler (size-based rotation, max 5MB per file, keep 5 backups)
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+    file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5)
+    handlers = [console_handler, file_handler]
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def configure_logging(log_file=LOG_FILE, level=LOG_LEVEL):
+    """
+    Starts the background listener that writes pipeline log records to the console and the
+    rotating log file. Called automatically by the first record a pipeline logger emits;
+    call it earlier to pick another file or level. Later calls in the same process do nothing.
+    """
+    with _lock:
+        if _state["pid"] == os.getpid():
+            return
+        level = getattr(logging, level) if isinstance(level, str) else level
+        _state["pid"] = os.getpid()
+        _state["queue"] = queue.SimpleQueue()
+        _state["handlers"] = _build_handlers(log_file, level)
+        _state["worker_queue"] = None
+        listener = logging.handlers.QueueListener(_state["queue"], *_state["handlers"], respect_handler_level=True)
+        listener.start()
+        _state["listeners"] = [listener]
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flushes queued records and stops the listeners of this process."""
+    with _lock:
+        if _state["pid"] != os.getpid():
+            return
+        for listener in _state["listeners"]:
+            listener.stop()
+        for handler in _state["handlers"]:
+            handler.close()
+        _state.update(pid=None, queue=None, handlers=[], listeners=[], worker_queue=None)
+
+
+def worker_log_queue():
+    """
+    Returns a multiprocessing queue for process-pool workers to log to. Records put on it are
+    written by a listener in this process, so workers never touch the log file themselves.
+    """
+    import multiprocessing
+
+    configure_logging()
+    with _lock:
+        if _state["worker_queue"] is None:
+            worker_queue = multiprocessing.Queue()
+            listener = logging.handlers.QueueListener(worker_queue, *_state["handlers"], respect_handler_level=True)
+            listener.start()
+            _state["listeners"].append(listener)
+            _state["worker_queue"] = worker_queue
+        return _state["worker_queue"]
+
+
+def init_worker_logging(log_queue):
+    """Pool initializer helper: sends this worker's pipeline log records to the parent's queue."""
+    with _lock:
+        _state.update(pid=os.getpid(), queue=log_queue, handlers=[], listeners=[], worker_queue=None)
+
+
+class _SharedQueueHandler(logging.handlers.QueueHandler):
+    """Puts records on the queue of the current process, configuring logging on first use."""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.queue = None
+        self.listener = None
+
+    def enqueue(self, record):
+        if _state["pid"] != os.getpid():
+            # First record in this process, or a forked child that was not set up as a worker
+            configure_logging()
+        _state["queue"].put_nowait(record)
+
+
+_handler = _SharedQueueHandler()
+
+
+def get_logger(name):
+    """Returns a pipeline logger whose records go through the shared, non-blocking queue."""
+    logger = logging.getLogger(name)
+    if _handler not in logger.handlers:
+        logger.setLevel(getattr(logging, LOG_LEVEL))
+        logger.addHandler(_handler)
+    return logger
+
+
+class SampledLog:
+    """
+    Gate for debug records on hot paths: lets through one call in every sample_every and at most
+    max_per_second of those. After allow() returns True, suppressed holds the number of calls
+    skipped since the previous record, so the message can report them.
+
+    Usage:
+        if sampler.allow():
+            logger.debug(f"... ({sampler.suppressed} similar records suppressed)")
+    """
+
+    def __init__(self, logger, sample_every=100, max_per_second=10):
+        self.logger = logger
+        self.sample_every = sample_every
+        self.max_per_second = max_per_second
+        self.calls = 0
+        self.suppressed = 0
+        self._pending = 0
+        self._window = 0
+        self._emitted = 0
+
+    def allow(self) -> bool:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return False
+        self.calls += 1
+        if (self.calls - 1) % self.sample_every:
+            self._pending += 1
+            return False
+        window = int(time.monotonic())
+        if window != self._window:
+            self._window, self._emitted = window, 0
+        if self._emitted >= self.max_per_second:
+            self._pending += 1
+            return False
+        self._emitted += 1
+        self.suppressed, self._pending = self._pending, 0
+        return True
@@ -0,0 +1,261 @@
+import re
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from size_grammar import (
+    FRACTION_PATTERN, FRACTIONS, SIZE_BRANCHES, SQ_FT_PER_ACRE, acreage_converter, extract_sizes, rewrite_fraction,
+    size_to_acres,
+)
+from census import CENSUS_COLUMNS
+from data_cleaner_and_processor import COUNTY_SOURCE_COLUMNS, SIZE_SOURCE_COLUMNS, DataProcessor, ExtractVariables
+from pipeline_logging import get_logger
+
+try:
+    import polars as pl
+except ImportError as e:
+    raise ImportError("The polars backend needs polars: pip install polars") from e
+
+logger = get_logger(__name__)
+
+
+def to_polars_grammar(branch: str) -> str:
+    """
+    Rewrites a size grammar branch for the Polars regex engine, which has no lookarounds.
+    Every (?<!\\w) precedes a letter and every (?!\\w) follows one, so on ASCII text both are word
+    boundaries. Python also counts characters such as '²' and '½' as word characters, so
+    process_frame only runs the rewritten grammar on ASCII rows.
+    """
+    return branch.replace(r"(?<!\w)", r"\b").replace(r"(?!\w)", r"\b")
+
+
+@lru_cache(maxsize=None)
+def size_grammar() -> str:
+    """The branch-labelled grammar: the branch that matched is the one non-null branch group."""
+    return "|".join(f"(?P<{name}>{to_polars_grammar(branch)})" for name, branch in SIZE_BRANCHES)
+
+
+@lru_cache(maxsize=None)
+def size_pattern() -> str:
+    """The grammar without capture groups, for extracting the whole first match."""
+    return "|".join(re.sub(r"\(\?P<\w+>", "(?:", to_polars_grammar(branch)) for _, branch in SIZE_BRANCHES)
+
+
+def text_series(series: pd.Series) -> "pl.Series":
+    """
+    A pandas column as a Polars string Series with nulls for missing values. Other values are
+    converted with str(), as the pandas stages do.
+    """
+    if pd.api.types.is_string_dtype(series.dtype) and series.dtype != object:
+        return pl.from_pandas(series, nan_to_null=True).rename(series.name)
+    values = series.astype(object)
+    present = values.notna()
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        is_text = values.map(lambda value: isinstance(value, str))
+        values = values.where(is_text | ~present, values.astype(str))
+    return pl.from_pandas(values.where(present, None).astype("string"), nan_to_null=True).rename(series.name)
+
+
+def _strip_zeros(digits):
+    # int() of a digit string drops its leading zeros
+    return digits.str.replace(r"^0+(\d)", "${1}")
+
+
+def _fraction_table(text):
+    """Value of the first FRACTIONS entry, in table order, that appears anywhere in the text."""
+    expr = pl.lit(None, dtype=pl.Float64)
+    for key, value in reversed(FRACTIONS):
+        expr = pl.when(text.str.contains(key, literal=True)).then(pl.lit(value)).otherwise(expr)
+    return expr
+
+
+def _dimension_parts(text, length, width):
+    area = length.cast(pl.Float64, strict=False) * width.cast(pl.Float64, strict=False)
+    table = _fraction_table(text)
+    return pl.coalesce(table, area), pl.when(table.is_null()).then(pl.lit(SQ_FT_PER_ACRE)).otherwise(pl.lit(1.0))
+
+
+def grammar_groups(size):
+    """The size grammar groups of the lowercased size, as a struct with one field per group."""
+    return size.str.to_lowercase().str.strip_chars().str.extract_groups(size_grammar())
+
+
+def acreage_parts(groups):
+    """
+    AcreageConverter.convert as two expressions over the struct of grammar_groups, a numerator
+    and a divisor. Polars divides by a constant by multiplying with its reciprocal, which can
+    be one ulp away from Python's division, so the caller divides with NumPy. The groups should
+    be a column rather than an expression, as every field read would repeat the search.
+    """
+    converter = acreage_converter()
+    field = groups.struct.field
+    unit_factors = {unit: factor for unit, factor in converter.unit_factors.items()}
+    one = pl.lit(1.0)
+
+    def written(group):
+        value = field(group).str.to_lowercase().replace_strict(
+            converter.written_words, default=None, return_dtype=pl.Float64
+        )
+        return value, one
+
+    def numeric(value, unit):
+        value, unit = field(value), field(unit)
+        factor = unit.str.to_lowercase().replace_strict(unit_factors, default=None, return_dtype=pl.Float64)
+        return pl.when(value.str.contains(",", literal=True)).then(None).otherwise(
+            value.cast(pl.Float64, strict=False) * factor
+        ), one
+
+    def fraction(num, den):
+        return field(num).cast(pl.Float64, strict=False), field(den).cast(pl.Float64, strict=False)
+
+    branches = {
+        "written": written("written_word"),
+        "written_cap": written("written_cap_word"),
+        "numeric": numeric("numeric_value", "numeric_unit"),
+        "hyphenated": numeric("hyphenated_value", "hyphenated_unit"),
+        "dimensions": _dimension_parts(field("dimensions"), field("length"), field("width")),
+        "fraction_th": fraction("fraction_th_num", "fraction_th_den"),
+        "fraction": fraction("fraction_num", "fraction_den"),
+        "per_acre": (pl.when(field("per_acre").str.contains("650 / acre", literal=True)).then(pl.lit(650.0)), one),
+        "edge_case": (pl.lit(0.25), one),
+        "ft_dimensions": _dimension_parts(field("ft_dimensions"), field("ft_length"), field("ft_width")),
+    }
+    numerator = pl.lit(None, dtype=pl.Float64)
+    divisor = one
+    for name, (value, by) in reversed(branches.items()):
+        matched = field(name).is_not_null()
+        numerator = pl.when(matched).then(value).otherwise(numerator)
+        divisor = pl.when(matched).then(by).otherwise(divisor)
+    return numerator, divisor
+
+
+def _python_sizes(texts: "pl.DataFrame") -> "pl.DataFrame":
+    """
+    Size and acreage, as DataProcessor.process finds them, of rows the Rust regex engine cannot
+    match like Python's: its \\b, \\d and float parsing only agree with Python on ASCII text,
+    while Python counts characters such as '²', '½' and '٣' as word characters and digits.
+    """
+    text = pd.Series(texts["text"].to_list(), dtype=object)
+    sizes, _ = extract_sizes(text)
+    sizes = sizes.map(lambda size: size if pd.isna(size) else rewrite_fraction(size))
+    return pl.DataFrame({
+        "row": texts["row"],
+        "size": pl.Series([None if pd.isna(size) else size for size in sizes], dtype=pl.String),
+        "numerator": pl.Series(sizes.map(size_to_acres).to_numpy(dtype=float), nan_to_null=False),
+        "divisor": pl.Series(np.ones(len(texts))),
+    }).filter(pl.col("size").is_not_null())
+
+
+def process_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    DataProcessor.process with the size stages on Polars: size extraction, fraction
+    preprocessing and acreage conversion run as one lazy query, except on rows with non-ASCII
+    text, which go through the Python grammar. The sizes and acreages are written back onto the
+    kept rows of the pandas frame, which DataProcessor.clean_price then finishes.
+    """
+    columns = [text_series(df[col]) for col in SIZE_SOURCE_COLUMNS]
+    columns.append(pl.Series("row", np.arange(len(df))))
+
+    normalized = [
+        pl.col(col).fill_null("nan").str.replace_all("Â", "A", literal=True).str.replace_all("×", "x", literal=True)
+        .str.replace_all("\n", " ", literal=True).str.strip_chars()
+        for col in SIZE_SOURCE_COLUMNS
+    ]
+    combined = normalized[0]
+    for text in normalized[1:]:
+        # Empty fields are skipped by the join, so only separate two non-empty parts
+        combined = pl.when((combined != "") & (text != "")).then(combined + "  " + text).otherwise(combined + text)
+    texts = pl.DataFrame(columns).lazy().select("row", text=combined).collect()
+    is_ascii = texts["text"].str.len_bytes() == texts["text"].str.len_chars()
+
+    fraction = pl.col("size").str.to_lowercase().str.strip_chars().str.extract_groups("(?i)" + FRACTION_PATTERN)
+    num, den = fraction.struct.field("1"), fraction.struct.field("2")
+    numerator, divisor = acreage_parts(pl.col("groups"))
+    sizes = (
+        texts.filter(is_ascii).lazy()
+        .with_columns(size=pl.col("text").str.extract(size_pattern(), 0))
+        .filter(pl.col("size").is_not_null())
+        .with_columns(
+            size=pl.when(num.is_not_null())
+            .then(pl.concat_str([_strip_zeros(num), pl.lit("/"), _strip_zeros(den), pl.lit(" acre")]))
+            .otherwise(pl.col("size"))
+        )
+        .with_columns(groups=grammar_groups(pl.col("size")))
+        .select("row", "size", numerator=numerator, divisor=divisor)
+        .collect()
+    )
+    if not is_ascii.all():
+        sizes = pl.concat([sizes, _python_sizes(texts.filter(~is_ascii))]).sort("row")
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        acreage = sizes["numerator"].to_numpy().astype(float) / sizes["divisor"].to_numpy().astype(float)
+    kept = ~np.isnan(acreage)
+    df = df.iloc[sizes["row"].to_numpy()[kept]].copy()
+    df['size'] = pd.Series(sizes["size"].filter(pl.Series(kept)).to_list(), index=df.index)
+    df['acreage'] = acreage[kept]
+    return DataProcessor.clean_price(df)
+
+
+def _county_expr(text, location_ranks, counties):
+    """The first county, in gazetteer order, with a location in the lowercased text."""
+    found = text.str.to_lowercase().str.extract_many(list(location_ranks), overlapping=True)
+    rank = found.list.eval(pl.element().replace_strict(location_ranks, return_dtype=pl.Int64)).list.min()
+    return rank.replace_strict(dict(enumerate(counties)), default=None, return_dtype=pl.String)
+
+
+def extract_frame(df: pd.DataFrame, store) -> pd.DataFrame:
+    """
+    ExtractVariables.extract with the county lookup, with its region fallback, and the census
+    join run as one Polars lazy query. Time on Jiji is parsed by ExtractVariables.parse_time_on_jiji
+    over its few hundred distinct values, as Polars divides by twelve by multiplying with the
+    reciprocal, one ulp away from Python's division.
+
+    Args:
+        df (pd.DataFrame): Output of DataProcessor.process.
+        store (GazetteerStore): The gazetteer and census data.
+    """
+    location_ranks = {}
+    for rank, locations in enumerate(store.kenyan_counties.values()):
+        for location in locations:
+            location_ranks.setdefault(location.lower(), rank)
+    counties = list(store.kenyan_counties)
+    dimension = store.dimension
+    census_keys = {county: key for county, key in dimension.add_aliases(counties).items() if key is not None}
+    census = pl.from_pandas(
+        dimension.table.rename(columns=CENSUS_COLUMNS).reset_index(), nan_to_null=False
+    ).lazy()
+
+    columns = [text_series(df[col]) for col in COUNTY_SOURCE_COLUMNS if col in df.columns]
+    fallback = [series.name for series in columns]
+    columns.append(pl.Series("row", np.arange(len(df))))
+    frame = pl.DataFrame(columns).lazy()
+
+    region = pl.col("region_name")
+    combined = pl.concat_str([pl.col(col) for col in fallback], separator=" ", ignore_nulls=True)
+
+    # Each distinct combination of location fields is looked up once, as with evaluate_unique
+    locations = (
+        frame
+        .select(fallback)
+        .unique()
+        .with_columns(county=_county_expr(region, location_ranks, counties))
+        .with_columns(county=pl.coalesce(pl.col("county"), _county_expr(combined, location_ranks, counties)))
+    )
+    result = (
+        frame
+        .join(locations, on=fallback, how="left", nulls_equal=True, maintain_order="left")
+        .with_columns(
+            census_county=pl.col("county").replace_strict(census_keys, default=None, return_dtype=pl.String),
+        )
+        .join(census, on="census_county", how="left", maintain_order="left")
+        .collect()
+    )
+
+    df['county'] = pd.Series([np.nan if county is None else county for county in result["county"].to_list()], index=df.index)
+    census_columns = list(CENSUS_COLUMNS.values())
+    df = df.drop(columns=[col for col in census_columns if col in df.columns])
+    enriched = result.select(census_columns).to_pandas()
+    enriched.index = df.index
+    df = pd.concat([df, enriched], axis=1)
+    df["years_on_jiji"] = ExtractVariables.parse_time_on_jiji(df['time_on_jiji'])
+    df.drop(columns=['time_on_jiji'], inplace=True)
+    return df
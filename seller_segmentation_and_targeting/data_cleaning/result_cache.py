@@ -0,0 +1,175 @@
+import hashlib
+import os
+import pickle
+import pandas as pd
+from data_ingestion import read_dataset
+from pipeline import clean_dataset
+from pipeline_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "seller_segmentation", "cleaned")
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2GB
+
+# Data files that, together with every module of the package, decide what the cleaned output looks like
+DATA_FILES = ("gazetteer.json",)
+# Namespace of the entries built by the default read_dataset + clean_dataset chain
+DEFAULT_NAMESPACE = "clean_dataset"
+
+_code_fingerprint = None
+
+
+def code_files() -> list:
+    """The package's modules, found on disk so a new module is never left out, and its data files."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    modules = sorted(name for name in os.listdir(directory) if name.endswith(".py"))
+    return modules + list(DATA_FILES)
+
+
+def code_fingerprint() -> str:
+    """Hash of the processing code and gazetteer data, computed once per process."""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        digest = hashlib.sha256()
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in code_files():
+            digest.update(name.encode("utf-8"))
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+        _code_fingerprint = digest.hexdigest()
+    return _code_fingerprint
+
+
+def file_digest(path, block_size=1024 * 1024) -> str:
+    """SHA-256 of a file's contents, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ResultCache:
+    """
+    Persistent cache of cleaned datasets, addressed by the input file's content and the
+    processing code fingerprint. Entries are Parquet files (pickles when pyarrow is missing);
+    the least recently used ones are evicted once the cache grows past max_bytes.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.extension = ".parquet" if _has_pyarrow() else ".pkl"
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, url, namespace=DEFAULT_NAMESPACE) -> str:
+        """
+        Cache key for an input CSV: its content hash combined with the code fingerprint and the
+        namespace of the computation that produced the entry.
+        """
+        return hashlib.sha256(f"{namespace}:{file_digest(url)}:{code_fingerprint()}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def namespace(compute=None) -> str:
+        """
+        The namespace of a compute function: its qualified name, or DEFAULT_NAMESPACE for the
+        default chain.
+
+        Raises:
+            ValueError: If compute is a lambda or nested function, whose name does not identify it.
+        """
+        if compute is None:
+            return DEFAULT_NAMESPACE
+        qualname = getattr(compute, "__qualname__", None)
+        if qualname is None or "<" in qualname:
+            raise ValueError(f"Pass a namespace to cache the results of {compute!r}")
+        return f"{compute.__module__}.{qualname}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.extension)
+
+    def _entries(self):
+        return [
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.endswith((".parquet", ".pkl"))
+        ]
+
+    def load(self, key):
+        """Returns the cached DataFrame for a key, or None on a miss."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        if self.extension == ".parquet":
+            return pd.read_parquet(path)
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def store(self, key, df: pd.DataFrame):
+        """Writes a DataFrame under a key, then evicts old entries if the cache is over budget."""
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        if self.extension == ".parquet":
+            df.to_parquet(tmp_path)
+        else:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries(), key=os.path.getmtime)
+        total = sum(os.path.getsize(path) for path in entries)
+        while entries and total > self.max_bytes:
+            path = entries.pop(0)
+            total -= os.path.getsize(path)
+            os.remove(path)
+            logger.info(f"Evicted cached dataset {os.path.basename(path)}")
+
+    def invalidate(self, url=None, namespace=DEFAULT_NAMESPACE):
+        """
+        Drops cached results: the entry for one input file and namespace when url is given,
+        otherwise all entries.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        if url is not None:
+            paths = [self._path(self.key(url, namespace))]
+        else:
+            paths = self._entries()
+        removed = 0
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def get_or_compute(self, url, compute=None, namespace=None) -> pd.DataFrame:
+        """
+        Loads the cleaned dataset for a CSV from the cache, computing and storing it on a miss.
+
+        Args:
+            url (str): Path to the listings CSV.
+            compute (callable, optional): Builds the cleaned DataFrame from the path. Defaults to
+                read_dataset followed by DataProcessor.process and ExtractVariables.extract.
+            namespace (str, optional): Keeps the results of different computations apart;
+                defaults to the qualified name of compute.
+        """
+        key = self.key(url, namespace or self.namespace(compute))
+        df = self.load(key)
+        if df is not None:
+            logger.info(f"Loaded cleaned dataset for {url} from cache")
+            return df
+        df = compute(url) if compute else clean_dataset(read_dataset(url))
+        self.store(key, df)
+        return df
@@ -0,0 +1,325 @@
+import re
+import time
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# Each branch of the property size grammar, in match priority order. Named groups capture the
+# numbers each branch needs so the acreage can be read off the match without re-parsing it.
+SIZE_BRANCHES = (
+    ("written", r"(?<!\w)(?P<written_word>(?:quarter|half|one?|two|three*?|four|for(?:t(?:h)?)?|five|fif(?:t(?:h)?)?|six(?:t(?:h)?)?|seven(?:t(?:h)?s?)?|eigh(?:t(?:h)?)?|nine(?:t(?:h)?)?|ten(?:t(?:h)?s?)?|eleven|twelve|thirteen|fourteen|fifteen|twenty|thirty|forty|fifty)(?:th|rd|nd|s)?)\s*(?:an\s+)?(?:acre|acres|ac|acr|acrs)(?!\w)"),  # Written numbers
+    ("written_cap", r"(?<!\w)(?P<written_cap_word>(?:[Qq]uarter|[Hh]alf|[Oo]ne|[Tt]wo|[Tt]hree|[Ff]our|[Ff]or(?:t(?:h)?)?|[Ff]ive|[Ff]if(?:t(?:h)?)?|[Ss]ix(?:t(?:h)?)?|[Ss]even(?:t(?:h)?s?)?|[Ee]igh(?:t(?:h)?)?|[Nn]ine(?:t(?:h)?)?|[Tt]en(?:t(?:h)?s?)?|[Ee]leven|[Tt]welve|[Tt]hirteen|[Ff]ourteen|[Ff]ifteen|[Tt]wenty|[Tt]hirty|[Ff]orty|[Ff]ifty)(?:th|rd|nd|s)?)\s*(?:an\s+)?(?:[Aa]cre|[Aa]cres|ac|acr|acrs)(?!\w)"),  # Capitalized written numbers
+    ("numeric", r"\b(?P<numeric_value>\d{1,3}(?:,\d{3})*(?:\.\d+)?)\s*(?P<numeric_unit>acres?|ac|acr|acrs|ha|hectares?)\b"),  # Numeric acres/hectares with commas
+    ("hyphenated", r"\b(?P<hyphenated_value>\d{1,3}(?:,\d{3})*(?:\.\d+)?)-(?P<hyphenated_unit>[Aa]cre|[Aa]cres|ac|acr|acrs|ha|[Hh]ectares?)\b"),  # Hyphenated numeric acres with commas
+    ("dimensions", r"\b(?P<length>\d+\.?\d*)\s*(?:[x*×#/-]|by)\s*(?P<width>\d+\.?\d*)\s*(?P<dimension_unit>ft|feet|fts|m)?\b"),  # Dimensions
+    ("fraction_th", r"\b(?P<fraction_th_num>\d+)/(?P<fraction_th_den>\d+)\s*th\s*(?:acre|acres|ac|acr|acrs)\b"),  # Fractions with 'th'
+    ("fraction", r"\b(?P<fraction_num>\d+)/(?P<fraction_den>\d+)\s*(?:acre|acres|ac|acr|acrs)\b"),  # Fractions without 'th'
+    ("per_acre", r"\b\d+\s*/\s*(?:acre|acres|ac|acr|acrs)\b"),  # Price per acre
+    ("edge_case", r"\b(?:slightly\s+more\s+than\s+a\s+quarter)\s*(?:acre|acres|ac|acr|acrs)\b"),  # Edge case
+    ("ft_dimensions", r"\b(?P<ft_length>\d+)\s*ft\s*\*\s*(?P<ft_width>\d+)\s*ft\b"),  # Specific ft format
+    ("plots", r"\bNumber\s+of\s+plots\s*:\s*\d+\b"),  # Number of plots
+)
+
+
+
+@lru_cache(maxsize=None)
+def size_grammar():
+    """Branch-labelled grammar, compiled on first use: match.lastgroup names the branch that fired."""
+    return re.compile("|".join(f"(?P<{name}>{branch})" for name, branch in SIZE_BRANCHES))
+
+
+@lru_cache(maxsize=None)
+def size_pattern():
+    """The same alternation with a single capture group, for Series.str.extract."""
+    return re.compile(
+        "(" + "|".join(re.sub(r"\(\?P<\w+>", "(?:", branch) for _, branch in SIZE_BRANCHES) + ")"
+    )
+
+
+# Unit anchors: every match of the grammar contains one of these, so text without any cannot
+# match. They are the acre and hectare tokens closing the unit branches, a digit-separator-digit
+# run for dimensions, and the 'ft *' and 'plots :' of the last two branches.
+SIZE_ANCHORS = r"[Aa]c(?:res?|rs?)?\b|(?:ha|[Hh]ectares?)\b|\d\.?\s*(?:[x*×#/-]|by)\s*\d|ft\s*\*|plots\s*:"
+# Before its first anchor a match holds at most this many letters ('slightly more than a quarter')
+# among digits, whitespace and ',./-', so a match can only start inside such a run before the anchor
+MAX_PREFIX_LETTERS = 24
+# Characters looked back from the anchor for that run; a longer run searches the whole text
+PREFIX_LOOKBACK = 256
+
+# BranchProfiler installed by grammar_profile.profile_branches; checked once per Series, not per row
+_profiler = None
+
+
+@lru_cache(maxsize=None)
+def size_anchors():
+    """The unit anchors, compiled on first use."""
+    return re.compile(SIZE_ANCHORS)
+
+
+@lru_cache(maxsize=None)
+def _reversed_prefix():
+    # Matches, on reversed text, the longest run that can precede an anchor inside a match
+    return re.compile(r"[\s\d,./-]*(?:[A-Za-z][\s\d,./-]*){0,%d}" % MAX_PREFIX_LETTERS)
+
+
+def window_start(text, anchor_start):
+    """Leftmost position at which a match containing the anchor at anchor_start could begin."""
+    low = max(0, anchor_start - PREFIX_LOOKBACK)
+    run = _reversed_prefix().match(text[low:anchor_start][::-1]).end()
+    if low > 0 and run == anchor_start - low:
+        return 0
+    return anchor_start - run
+
+
+def extract_sizes(text: pd.Series, on_row=None):
+    """
+    The first size mention in every row of a text Series, as Series.str.extract(size_pattern())
+    would return it. A cheap scan for the first unit anchor rejects text without one, and the
+    grammar then searches from the start of the run before the anchor (see window_start) instead
+    of from the start of the text; lookbehinds and word boundaries still see the characters
+    before the window.
+
+    Args:
+        text (pd.Series): Normalized listing text.
+        on_row (callable, optional): Called for every row with its anchor match, its grammar
+            match and the seconds both searches took; either match is None when absent. Matches
+            then come from size_grammar(), so match.lastgroup names the branch. Defaults to the
+            installed BranchProfiler's record_extraction while branches are profiled.
+
+    Returns:
+        tuple: The sizes as a Series aligned with text (NaN where nothing matches), and the
+            number of rows the anchor scan rejected.
+    """
+    if on_row is None and _profiler is not None:
+        on_row = _profiler.record_extraction
+    sizes = []
+    rejected = 0
+    anchors = size_anchors().search
+    if on_row is None:
+        pattern, group, clock = size_pattern().search, 1, None
+    else:
+        pattern, group, clock = size_grammar().search, 0, time.perf_counter
+    for value in text.to_numpy(dtype=object):
+        start = clock() if clock else None
+        anchor = anchors(value)
+        match = None if anchor is None else pattern(value, window_start(value, anchor.start()))
+        if clock:
+            on_row(anchor, match, clock() - start)
+        if anchor is None:
+            rejected += 1
+        sizes.append(match[group] if match else np.nan)
+    return pd.Series(sizes, index=text.index, name=text.name, dtype=text.dtype), rejected
+
+# Fractions such as '1/8acre' or '3/4th acres', rewritten to 'n/d acre' before conversion
+FRACTION_PATTERN = r'\b(\d+)/(\d+)(?:\s*th)?(?:\s*|-)?(?:acre|acres|ac|acr|acrs)\b'
+
+SQ_FT_PER_ACRE = 43560.0
+ACRES_PER_HECTARE = 2.471
+
+WRITTEN_NUMBERS = {
+    'quarter': 0.25, 'half': 0.5, 'on': 1, 'one': 1.0, 'two': 2.0, 'three': 3.0, 'four': 4.0,
+    'five': 5.0, 'six': 6.0, 'seven': 7.0, 'eight': 8.0, 'eighth': 0.125, 'nine': 9.0,
+    'ten': 10.0, 'eleven': 11.0, 'twelve': 12.0, 'thirteen': 13.0, 'fourteen': 14.0,
+    'fifteen': 15.0, 'sixteen': 16.0, 'seventeen': 17.0, 'eighteen': 18.0, 'nineteen': 19.0,
+    'twenty': 20.0, 'thirty': 30.0, 'forty': 40.0, 'fifty': 50.0, 'sixty': 60.0,
+    'seventy': 70.0, 'eighty': 80.0, 'ninety': 90.0
+}
+TENS = ('twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+UNITS = ('one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine')
+
+# Words the acreage parser recognizes, with the ordinal/plural suffix it tolerates
+WRITTEN_WORD = re.compile(
+    r"(quarter|half|one*?|two|three*?|four|five|six|seven|eigh(?:t|th)|nine|ten|eleven|twelve|thirteen|fourteen"
+    r"|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)"
+    r"(?:th|rd|nd|s)?"
+)
+
+# Every word form the written-number branches of the grammar can match, before the suffix
+GRAMMAR_WORDS = (
+    'quarter', 'half', 'on', 'one', 'two', 'thre', 'three', 'four', 'for', 'fort', 'forth', 'five', 'fif', 'fift',
+    'fifth', 'six', 'sixt', 'sixth', 'seven', 'sevent', 'seventh', 'sevents', 'sevenths', 'eigh', 'eight',
+    'eighth', 'nine', 'ninet', 'nineth', 'ten', 'tent', 'tenth', 'tents', 'tenths', 'eleven', 'twelve',
+    'thirteen', 'fourteen', 'fifteen', 'twenty', 'thirty', 'forty', 'fifty'
+)
+
+# Bare fractions in the order they are tried; the first one found anywhere in the size text wins
+FRACTIONS = (
+    ('1/2', 0.5), ('1/4', 0.25), ('1/8', 0.125), ('1/3', 0.3333), ('2/3', 0.6667), ('3/4', 0.75),
+    ('5/8', 0.625), ('7/8', 0.875), ('1/5', 0.2), ('2/5', 0.4), ('3/5', 0.6), ('4/5', 0.8),
+    ('1/6', 0.1667), ('5/6', 0.8333), ('1/10', 0.1), ('9/10', 0.9), ('3/8', 0.375)
+)
+
+
+class AcreageConverter:
+    """
+    Converts size grammar matches to acres. The fraction table, written numbers from one to
+    nine hundred and ninety-nine and the unit factors are built once into dictionaries, so
+    converting a match is a handful of O(1) lookups.
+    """
+
+    def __init__(self):
+        self.unit_factors = {unit: 1.0 for unit in ('acre', 'acres', 'ac', 'acr', 'acrs')}
+        self.unit_factors.update({unit: ACRES_PER_HECTARE for unit in ('ha', 'hectare', 'hectares')})
+        # Square units per acre; dimensions in metres have always been read as feet
+        self.area_units = {unit: SQ_FT_PER_ACRE for unit in ('ft', 'feet', 'fts', 'm', None)}
+        self.fractions = {key: (rank, value) for rank, (key, value) in enumerate(FRACTIONS)}
+        self.written_numbers = self._build_written_numbers()
+        self.written_words = {
+            word + suffix: self._parse_written_word(word + suffix)
+            for word in GRAMMAR_WORDS for suffix in ('', 'th', 'rd', 'nd', 's')
+        }
+
+    @staticmethod
+    def _build_written_numbers():
+        numbers = dict(WRITTEN_NUMBERS)
+        numbers.update({f'{t} {u}': WRITTEN_NUMBERS[t] + WRITTEN_NUMBERS[u] for t in TENS for u in UNITS})
+        below_hundred = dict(numbers)
+        for i, hundred in enumerate(UNITS, start=1):
+            numbers[f'{hundred} hundred'] = i * 100.0
+            numbers.update({f'{hundred} hundred {rest}': i * 100.0 + value for rest, value in below_hundred.items()})
+        return numbers
+
+    def parse_written_number(self, text):
+        """Parse written numbers from 1 to 999, returning None if the text is not a number."""
+        text = text.lower().replace(' an ', ' ').replace(' and ', ' ').strip()
+        text = re.sub(r'(?:th|rd|nd|s)?\s*(?:acre|acres|ac|acr|acrs)\b', '', text).strip()
+        if text in self.written_numbers:
+            return self.written_numbers[text]
+        if re.match(r'^\d+\.\d+$', text):
+            return float(text)
+
+        # Irregular phrasings such as "ten hundred five" are summed word by word
+        parts = text.split()
+        total = 0.0
+        if len(parts) > 1 and parts[1] == 'hundred':
+            total += (UNITS.index(parts[0]) + 1) * 100.0 if parts[0] in UNITS else 0.0
+            if len(parts) > 2:
+                total += WRITTEN_NUMBERS.get(parts[2], 0.0)
+                total += WRITTEN_NUMBERS.get(parts[3], 0.0) if len(parts) > 3 else 0.0
+        return float(total) if total > 0 else None
+
+    def _parse_written_word(self, word):
+        match = WRITTEN_WORD.fullmatch(word)
+        if not match:
+            return np.nan
+        value = self.parse_written_number(match.group(1))
+        return np.nan if value is None else value
+
+    def written_acres(self, word):
+        word = word.lower()
+        value = self.written_words.get(word)
+        return self._parse_written_word(word) if value is None else value
+
+    def numeric_acres(self, value, unit):
+        # Comma-grouped figures are matched by the grammar but never parsed into acreage
+        if ',' in value:
+            return np.nan
+        return float(value) * self.unit_factors[unit.lower()]
+
+    def fraction_acres(self, text):
+        """Value of the first known fraction, in table order, that appears anywhere in the text."""
+        best = None
+        position = text.find('/', 1)
+        while position != -1:
+            head = text[position - 1]
+            for key in (head + text[position:position + 2], head + text[position:position + 3]):
+                entry = self.fractions.get(key)
+                if entry is not None and (best is None or entry[0] < best[0]):
+                    best = entry
+            position = text.find('/', position + 1)
+        return None if best is None else best[1]
+
+    def dimension_acres(self, text, length, width, unit=None):
+        value = self.fraction_acres(text)
+        if value is not None:
+            return value
+        return float(length) * float(width) / self.area_units[unit]
+
+    def from_match(self, match):
+        """
+        Converts a SIZE_GRAMMAR match to acres.
+
+        Args:
+            match (re.Match): A match of SIZE_GRAMMAR.
+
+        Returns:
+            float or np.nan: The size in acres, or np.nan if the branch has no acreage.
+        """
+        branch = match.lastgroup
+        if branch == 'written':
+            return self.written_acres(match['written_word'])
+        if branch == 'written_cap':
+            return self.written_acres(match['written_cap_word'])
+        if branch == 'numeric':
+            return self.numeric_acres(match['numeric_value'], match['numeric_unit'])
+        if branch == 'hyphenated':
+            return self.numeric_acres(match['hyphenated_value'], match['hyphenated_unit'])
+        if branch == 'dimensions':
+            return self.dimension_acres(match[0], match['length'], match['width'], match['dimension_unit'])
+        if branch in ('fraction_th', 'fraction'):
+            return float(match[f'{branch}_num']) / int(match[f'{branch}_den'])
+        if branch == 'per_acre':
+            return 650.0 if '650 / acre' in match[0].lower() else np.nan
+        if branch == 'edge_case':
+            return 0.25
+        if branch == 'ft_dimensions':
+            return self.dimension_acres(match[0], match['ft_length'], match['ft_width'], 'ft')
+        return np.nan
+
+    def convert(self, size):
+        """
+        Converts a 'size' value to acres with a single grammar match.
+
+        Args:
+            size (str): A size string as left by DataProcessor.enhanced_fraction_parsing.
+
+        Returns:
+            float or np.nan: The size in acres, or np.nan if it cannot be converted.
+        """
+        if pd.isna(size):
+            return np.nan
+        match = size_grammar().search(str(size).lower().strip())
+        if not match:
+            return np.nan
+        return self.from_match(match)
+
+
+@lru_cache(maxsize=None)
+def acreage_converter() -> AcreageConverter:
+    """The shared AcreageConverter, built on first use."""
+    return AcreageConverter()
+
+
+# Compiled grammars and the converter used to be built at import; keep the old names working
+_LAZY_ATTRIBUTES = {"SIZE_GRAMMAR": size_grammar, "SIZE_PATTERN": size_pattern, "converter": acreage_converter}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def fraction_pattern() -> re.Pattern:
+    """FRACTION_PATTERN compiled case-insensitively, on first use."""
+    return re.compile(FRACTION_PATTERN, re.IGNORECASE)
+
+
+def rewrite_fraction(size):
+    """Rewrites a size holding a fraction of an acre as 'n/d acre'; other sizes are returned unchanged."""
+    match = fraction_pattern().search(str(size).lower().strip())
+    if match:
+        num, denom = map(int, match.groups())
+        return f"{num}/{denom} acre"
+    return size
+
+
+def size_to_acres(size):
+    """Converts a 'size' value to acres with the shared AcreageConverter."""
+    return acreage_converter().convert(size)
+
+
+def size_converter():
+    """The per-value size conversion to apply: size_to_acres, or its timed version while branches are profiled."""
+    return size_to_acres if _profiler is None else _profiler.size_to_acres
@@ -0,0 +1,104 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+SEGMENTATION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "segmentation")
+if SEGMENTATION_DIR not in sys.path:
+    sys.path.append(SEGMENTATION_DIR)
+
+from seller_segments import SellerSegmenter
+
+SELLER_COL = "seller_or_agent_name"
+
+
+class SellerAnalytics:
+    """
+    Seller-level view of the cleaned listings.
+
+    The listings are grouped by seller once: a summary table with one row per seller, county and
+    property-use distributions indexed by seller, and a group index that slices one seller's
+    listings in time proportional to their listing count instead of scanning the whole frame.
+
+    Args:
+        data (pd.DataFrame): Output of DataProcessor.process and ExtractVariables.extract.
+        seller_col (str): Column naming the seller or agent.
+        segmenter (SellerSegmenter, optional): Cuts the seller_status column with its tenure
+                tiers; defaults to the default tiers.
+    """
+
+    def __init__(self, data: pd.DataFrame, seller_col: str = SELLER_COL, segmenter=None):
+        self.data = data
+        self.seller_col = seller_col
+        self.segmenter = segmenter or SellerSegmenter()
+        codes, sellers = pd.factorize(data[seller_col])
+        # Row positions grouped by seller; rows without a seller (code -1) sort first and are skipped
+        self._order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(sellers))
+        self._offsets = np.concatenate(([0], np.cumsum(counts))) + np.count_nonzero(codes < 0)
+        self._positions = {seller: i for i, seller in enumerate(sellers)}
+        self.summary = self._summarize(codes, sellers, counts)
+        self.county_distribution, self._county_ranges = self._distribution("county")
+        self.property_use_distribution, self._property_use_ranges = self._distribution("property_use")
+
+    def _summarize(self, codes, sellers, counts) -> pd.DataFrame:
+        data = self.data
+        present = codes >= 0
+        grouped = pd.DataFrame({
+            "code": codes[present],
+            "price_per_acre": data["price_per_acre(KES)"].to_numpy(dtype=float, na_value=np.nan)[present],
+            "years_on_jiji": data["years_on_jiji"].to_numpy(dtype=float, na_value=np.nan)[present],
+            "county": data["county"].to_numpy(dtype=object)[present],
+            "property_use": data["property_use"].to_numpy(dtype=object)[present],
+        }).groupby("code", sort=True)
+        summary = pd.DataFrame({
+            "listing_count": counts,
+            "county_count": grouped["county"].nunique().to_numpy(),
+            "property_use_count": grouped["property_use"].nunique().to_numpy(),
+            "median_price_per_acre(KES)": grouped["price_per_acre"].median().to_numpy(),
+            # An account's time on Jiji only grows, so the latest listing carries the current value
+            "years_on_jiji": grouped["years_on_jiji"].max().to_numpy(),
+        }, index=pd.Index(sellers, name=self.seller_col))
+        summary["seller_status"] = self.segmenter.tenure_tiers(summary["years_on_jiji"])
+        return summary
+
+    def _distribution(self, col):
+        """
+        Listing counts per (seller, value), sorted by seller then descending count, with the
+        position range of each seller's rows.
+        """
+        counts = self.data.groupby([self.seller_col, col], observed=True, sort=False).size()
+        frame = counts.rename("count").reset_index()
+        frame = frame.sort_values([self.seller_col, "count"], ascending=[True, False], kind="stable")
+        distribution = frame.set_index([self.seller_col, col])["count"]
+        sellers = frame[self.seller_col].to_numpy()
+        starts = np.flatnonzero(np.r_[True, sellers[1:] != sellers[:-1]]) if len(sellers) else np.array([], dtype=int)
+        stops = np.r_[starts[1:], len(sellers)]
+        ranges = {sellers[start]: (start, stop) for start, stop in zip(starts, stops)}
+        return distribution, ranges
+
+    def listings(self, seller) -> pd.DataFrame:
+        """Returns one seller's listings, in their original order."""
+        i = self._positions.get(seller)
+        if i is None:
+            return self.data.iloc[0:0]
+        return self.data.iloc[self._order[self._offsets[i]:self._offsets[i + 1]]]
+
+    def top_listers(self, n: int = 10) -> pd.DataFrame:
+        """The n sellers with the most listings."""
+        return self.summary.nlargest(n, "listing_count", keep="first")
+
+    def counties(self, seller, top=None) -> pd.Series:
+        """A seller's listing counts by county, largest first."""
+        return self._slice(self.county_distribution, self._county_ranges, seller, top)
+
+    def property_uses(self, seller, top=None) -> pd.Series:
+        """A seller's listing counts by property use, largest first."""
+        return self._slice(self.property_use_distribution, self._property_use_ranges, seller, top)
+
+    @staticmethod
+    def _slice(distribution, ranges, seller, top):
+        start, stop = ranges.get(seller, (0, 0))
+        if top is not None:
+            stop = min(stop, start + top)
+        return distribution.iloc[start:stop].droplevel(0)
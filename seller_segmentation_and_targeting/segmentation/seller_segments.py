@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+
+SELLER_COL = "seller_or_agent_name"
+
+# Tier edges and labels per feature. Bins are right-closed, (edge[i], edge[i + 1]], with the
+# first bin also holding its lower edge; values outside the edges and NaN get no tier.
+DEFAULT_TIERS = {
+    "tenure": {
+        "edges": (0, 1, 4, np.inf),
+        "labels": ("New Seller", "Established Seller", "Long-standing Seller"),
+    },
+    "listing_volume": {
+        "edges": (0, 1, 5, 20, np.inf),
+        "labels": ("Single listing", "Occasional", "Active", "Power lister"),
+    },
+    "county_spread": {
+        "edges": (0, 1, 3, np.inf),
+        "labels": ("Single county", "Regional", "National"),
+    },
+    "price_band": {
+        "edges": (0, 1_000_000, 5_000_000, 20_000_000, np.inf),
+        "labels": ("Budget", "Mid-market", "Premium", "Luxury"),
+    },
+}
+
+# Seller-level feature each tier is cut from
+TIER_FEATURES = {
+    "tenure": "years_on_jiji",
+    "listing_volume": "listing_count",
+    "county_spread": "county_count",
+    "price_band": "median_price_per_acre(KES)",
+}
+
+
+class SellerSegmenter:
+    """
+    Assigns sellers to tiers by binning numeric features on configurable edges, and combines
+    the tiers into one multi-feature segment.
+
+    Args:
+        tiers (dict, optional): Overrides for DEFAULT_TIERS, e.g.
+                {"tenure": {"edges": (0, 2, 5, np.inf), "labels": ("New", "Mid", "Veteran")}}.
+    """
+
+    def __init__(self, tiers=None):
+        self.tiers = {name: dict(spec) for name, spec in DEFAULT_TIERS.items()}
+        for name, spec in (tiers or {}).items():
+            if name not in self.tiers:
+                raise ValueError(f"Unknown tier {name!r}; expected one of {sorted(self.tiers)}")
+            self.tiers[name].update(spec)
+        for name, spec in self.tiers.items():
+            if len(spec["labels"]) != len(spec["edges"]) - 1:
+                raise ValueError(f"Tier {name!r} needs one label per bin: {len(spec['edges']) - 1} labels")
+            if list(spec["edges"]) != sorted(spec["edges"]):
+                raise ValueError(f"Tier {name!r} edges must be increasing")
+
+    def tier(self, values: pd.Series, name: str) -> pd.Series:
+        """Bins a numeric Series into the named tier, returning a categorical Series."""
+        spec = self.tiers[name]
+        return pd.cut(
+            values.astype(float), bins=list(spec["edges"]), labels=list(spec["labels"]),
+            right=True, include_lowest=True,
+        )
+
+    def tenure_tiers(self, years_on_jiji: pd.Series) -> pd.Series:
+        """
+        Seller status of each listing from years_on_jiji. Unlike the notebook's lambda, 1.0
+        falls only in the first tier, and negative or missing tenure is left untiered.
+        """
+        return self.tier(years_on_jiji, "tenure").rename("seller_status")
+
+    @staticmethod
+    def seller_features(data: pd.DataFrame, seller_col: str = SELLER_COL) -> pd.DataFrame:
+        """
+        One grouped pass computing, per seller, the features the tiers are cut from:
+        listing_count, county_count, median_price_per_acre(KES) and years_on_jiji.
+        """
+        return data.groupby(seller_col, sort=False).agg(**{
+            "listing_count": (seller_col, "size"),
+            "county_count": ("county", "nunique"),
+            "median_price_per_acre(KES)": ("price_per_acre(KES)", "median"),
+            "years_on_jiji": ("years_on_jiji", "max"),
+        })
+
+    def segment_sellers(self, data: pd.DataFrame, seller_col: str = SELLER_COL) -> pd.DataFrame:
+        """
+        Builds the seller features and assigns every tier plus the combined segment.
+
+        Args:
+            data (pd.DataFrame): Cleaned listings from DataProcessor.process and ExtractVariables.extract.
+            seller_col (str): Column naming the seller or agent.
+
+        Returns:
+            pd.DataFrame: One row per seller with the features, one categorical column per tier
+                and a categorical 'segment' joining the tiers, e.g. 'New Seller | Active | Regional | Premium'.
+                Sellers missing any tier get no segment.
+        """
+        sellers = self.seller_features(data, seller_col)
+        for name, feature in TIER_FEATURES.items():
+            sellers[name] = self.tier(sellers[feature], name)
+        sellers["segment"] = self.combine(sellers[list(TIER_FEATURES)])
+        return sellers
+
+    @staticmethod
+    def combine(tiers: pd.DataFrame) -> pd.Categorical:
+        """
+        Joins categorical tier columns into one categorical segment by mixed-radix arithmetic
+        on the category codes, so no per-row strings are built.
+        """
+        codes = np.zeros(len(tiers), dtype=np.int64)
+        missing = np.zeros(len(tiers), dtype=bool)
+        labels = [""]
+        for i, col in enumerate(tiers.columns):
+            categorical = tiers[col].cat
+            codes = codes * len(categorical.categories) + categorical.codes.to_numpy()
+            missing |= categorical.codes.to_numpy() < 0
+            labels = [
+                f"{prefix} | {label}" if i else str(label)
+                for prefix in labels for label in categorical.categories
+            ]
+        codes[missing] = -1
+        return pd.Categorical.from_codes(codes, categories=labels)
+
+    def segment_listings(self, data: pd.DataFrame, seller_col: str = SELLER_COL) -> pd.DataFrame:
+        """Adds each listing's seller tiers and segment as categorical columns."""
+        sellers = self.segment_sellers(data, seller_col)
+        positions = sellers.index.get_indexer(data[seller_col])
+        out = data.copy()
+        for col in [*TIER_FEATURES, "segment"]:
+            categorical = sellers[col].array
+            codes = np.where(positions >= 0, categorical.codes[positions], -1)
+            out[col] = pd.Categorical.from_codes(codes, dtype=categorical.dtype)
+        return out